@@ -9,6 +9,8 @@ import sys
 import os
 import atexit
 import concurrent.futures
+import errno
+import selectors
 import socket
 from datetime import datetime
 from typing import List
@@ -26,6 +28,17 @@ import constants
 
 logger = logging.getLogger(__name__)
 
+# Python logging level for each GUI log level
+_PY_LOG_LEVELS = {
+    LogLevel.DEBUG: logging.DEBUG,
+    LogLevel.INFO: logging.INFO,
+    LogLevel.WARNING: logging.WARNING,
+    LogLevel.ERROR: logging.ERROR,
+}
+
+# Seconds to let state changes settle before writing them out
+_STATE_SAVE_DEBOUNCE = 2.0
+
 
 class WireproxyManager:
     """Main application class that coordinates all components"""
@@ -42,25 +55,35 @@ class WireproxyManager:
         # Monitoring
         self.monitor_thread = None
         self.shutdown_event = threading.Event()
+        self.servers_loaded_event = threading.Event()  # Set once a server list is in state
+        self._state_loaded = False  # Saved state is loaded once, after the first server list
         self._last_force_update = time.time()
+        self._last_status_snapshot = ()
+        self._pending_restart_ids = set()  # Tk after() ids of scheduled auto-restarts
         self.thread_pool = concurrent.futures.ThreadPoolExecutor(max_workers=4)
+        self._save_requested = threading.Event()  # Set when state changed and needs writing
+        self._saver_thread = None
+        self._saver_lock = threading.Lock()
+
+        # Log level dialog, built on first use and reused afterwards
+        self._log_level_dialog = None
+        self._log_level_var = None
 
         # Register cleanup on exit
         atexit.register(lambda: StateManager.cleanup_temp_files(self.state))
 
-    def log_message(self, message: str, level: LogLevel = LogLevel.INFO):
-        """Thread-safe logging"""
+    def log_message(self, message: str, *args, level: LogLevel = LogLevel.INFO):
+        """Thread-safe logging; %-style args are only formatted when the line is kept"""
+        py_level = _PY_LOG_LEVELS[level]
+        if level.value < self.settings.log_level.value and not logger.isEnabledFor(py_level):
+            return
+        if args:
+            message = message % args
+
         self.gui_queue.put_log_message(message, level)
 
         # Also log to Python logger
-        if level == LogLevel.DEBUG:
-            logger.debug(message)
-        elif level == LogLevel.INFO:
-            logger.info(message)
-        elif level == LogLevel.WARNING:
-            logger.warning(message)
-        elif level == LogLevel.ERROR:
-            logger.error(message)
+        logger.log(py_level, message)
 
     def update_status(self, message: str):
         """Thread-safe status updates"""
@@ -91,9 +114,20 @@ class WireproxyManager:
                         self.main_window.update_proxy_list_display()
                     elif message[0] == 'server_update':
                         self.main_window.update_server_dropdown(message[1])
+                        self._delayed_state_load()
+                    elif message[0] == 'message_box':
+                        show = messagebox.showerror if message[1] == 'error' else messagebox.showinfo
+                        show(message[2], message[3])
+                    elif message[0] == 'auto_restart':
+                        self._restart_proxies(message[1])
+                    elif message[0] == 'callback':
+                        message[1](*message[2])
                 except Exception as e:
                     logger.error(f"Error processing message {message[0]}: {e}")
 
+            # Write every log line received this tick in one go
+            self.main_window.flush_log_display()
+
             # Controlled force update every 10 seconds (reduced frequency)
             current_time = time.time()
             if current_time - self._last_force_update > 10:
@@ -112,6 +146,19 @@ class WireproxyManager:
             if self.main_window and self.main_window.root:
                 self.main_window.root.after(500, self.process_gui_messages)
 
+    def _status_tick(self):
+        """Redraw the proxy list when any proxy was added, removed or changed status"""
+        try:
+            snapshot = tuple((id(instance), instance.status) for instance in self.state.get_proxy_instances())
+            if snapshot != self._last_status_snapshot:
+                self._last_status_snapshot = snapshot
+                self.main_window.update_proxy_list_display()
+        except Exception as e:
+            logger.error(f"Error in status tick: {e}")
+
+        if self.main_window and self.main_window.root:
+            self.main_window.root.after(200, self._status_tick)
+
     def start_monitoring(self):
         """Start the process monitoring thread"""
         if self.monitor_thread and self.monitor_thread.is_alive():
@@ -120,7 +167,26 @@ class WireproxyManager:
         self.shutdown_event.clear()
         self.monitor_thread = threading.Thread(target=self._monitor_processes, daemon=True)
         self.monitor_thread.start()
-        self.log_message("Process monitor started", LogLevel.DEBUG)
+        self.log_message("Process monitor started", level=LogLevel.DEBUG)
+
+    def request_state_save(self):
+        """Mark state dirty; a background thread writes it once changes settle"""
+        self._save_requested.set()
+        with self._saver_lock:
+            if self._saver_thread is None or not self._saver_thread.is_alive():
+                self._saver_thread = threading.Thread(target=self._state_saver_loop, daemon=True)
+                self._saver_thread.start()
+
+    def _state_saver_loop(self):
+        """Coalesce bursts of save requests into one write (runs in background thread)"""
+        while True:
+            # on_closing sets this too, after shutdown_event, to wake the thread
+            self._save_requested.wait()
+            # Shutdown writes its own final snapshot
+            if self.shutdown_event.wait(_STATE_SAVE_DEBOUNCE):
+                break
+            self._save_requested.clear()
+            StateManager.save_state(self.state, self.settings)
 
     def _monitor_processes(self):
         """Monitor running processes (runs in background thread)"""
@@ -129,7 +195,7 @@ class WireproxyManager:
                 self._check_running_proxies()
                 self.shutdown_event.wait(5)
             except Exception as e:
-                self.log_message(f"Error in process monitor: {str(e)}", LogLevel.ERROR)
+                self.log_message("Error in process monitor: %s", e, level=LogLevel.ERROR)
                 self.shutdown_event.wait(10)
 
     def _check_running_proxies(self):
@@ -144,7 +210,7 @@ class WireproxyManager:
                     self._monitor_resource_usage(i, instance, process_info)
 
     def _handle_unexpected_process_termination(self, index, instance):
-        self.log_message(f"Process for port {instance.port} has died unexpectedly", LogLevel.ERROR)
+        self.log_message("Process for port %s has died unexpectedly", instance.port, level=LogLevel.ERROR)
         self.state.update_proxy_status(index, ProxyStatus.STOPPED)
         removed_process = self.state.remove_running_process(index)
         if removed_process:
@@ -162,7 +228,7 @@ class WireproxyManager:
             memory_mb = ps_process.memory_info().rss / 1024 / 1024
             self._check_cpu_usage(index, instance, process_info, cpu_percent)
             if cpu_percent > 1.0 or memory_mb > 50:
-                self.log_message(f"Port {instance.port}: CPU: {cpu_percent:.1f}%, Memory: {memory_mb:.1f}MB", LogLevel.DEBUG)
+                self.log_message("Port %s: CPU: %.1f%%, Memory: %.1fMB", instance.port, cpu_percent, memory_mb, level=LogLevel.DEBUG)
         except (psutil.NoSuchProcess, psutil.AccessDenied, AttributeError):
             pass
 
@@ -171,7 +237,7 @@ class WireproxyManager:
             if process_info.high_cpu_start is None:
                 process_info.high_cpu_start = time.time()
             elif time.time() - process_info.high_cpu_start > 30:
-                self.log_message(f"Killing process on port {instance.port} due to high CPU usage", LogLevel.WARNING)
+                self.log_message("Killing process on port %s due to high CPU usage", instance.port, level=LogLevel.WARNING)
                 ProcessManager.stop_process_gracefully(process_info, timeout=2)
                 self.state.update_proxy_status(index, ProxyStatus.ERROR)
                 self.state.remove_running_process(index)
@@ -185,7 +251,7 @@ class WireproxyManager:
         def fetch_servers():
             try:
                 self.update_status(constants.STATUS_LOADING_SERVERS)
-                self.log_message("Starting server fetch from SurfShark API...", LogLevel.INFO)
+                self.log_message("Starting server fetch from SurfShark API...", level=LogLevel.INFO)
 
                 # Try to fetch fresh servers
                 servers = NetworkManager.fetch_servers_with_retry(self.settings.api_endpoint)
@@ -195,17 +261,18 @@ class WireproxyManager:
                     StateManager.save_servers_cache(servers)
                 else:
                     # Try to load from cache as fallback
-                    self.log_message("Failed to fetch servers, trying cache...", LogLevel.WARNING)
+                    self.log_message("Failed to fetch servers, trying cache...", level=LogLevel.WARNING)
                     servers = StateManager.load_servers_cache()
 
                     if servers:
-                        self.log_message("Loaded servers from cache", LogLevel.INFO)
+                        self.log_message("Loaded servers from cache", level=LogLevel.INFO)
                     else:
                         self.update_status(constants.STATUS_ERROR_LOADING_SERVERS)
-                        self.log_message("Failed to load servers from API and cache", LogLevel.ERROR)
+                        self.log_message("Failed to load servers from API and cache", level=LogLevel.ERROR)
                         return
 
-                self.state.set_servers(servers)
+                self.state.set_server_index(ServerManager.build_index(servers))
+                self.servers_loaded_event.set()
 
                 # Process servers for dropdown
                 country_options = ServerManager.process_servers(servers)
@@ -216,14 +283,14 @@ class WireproxyManager:
                 self.log_message(
                     f"Loaded {len(servers)} servers from {total_countries} countries, "
                     f"{total_locations} locations",
-                    LogLevel.INFO
+                    level=LogLevel.INFO
                 )
 
                 self.update_status(constants.STATUS_READY.format(countries=total_countries, locations=total_locations))
                 self.gui_queue.put_server_update(country_options)
 
             except Exception as e:
-                self.log_message(f"Error loading servers: {str(e)}", LogLevel.ERROR)
+                self.log_message(f"Error loading servers: {str(e)}", level=LogLevel.ERROR)
                 self.update_status(constants.STATUS_ERROR_LOADING_SERVERS)
 
         # Use thread pool for better management
@@ -233,22 +300,22 @@ class WireproxyManager:
         """Add a new SOCKS5 proxy with comprehensive validation"""
         try:
             if not self.main_window or not self.main_window.country_var or not self.main_window.port_var:
-                self.log_message("GUI not properly initialized", LogLevel.ERROR)
+                self.log_message("GUI not properly initialized", level=LogLevel.ERROR)
                 return
 
             country = self.main_window.country_var.get()
             port = self.main_window.port_var.get()
 
-            self.log_message(f"Attempting to add proxy: Country={country}, Port={port}", LogLevel.DEBUG)
+            self.log_message("Attempting to add proxy: Country=%s, Port=%s", country, port, level=LogLevel.DEBUG)
 
             # Validation
             if not country:
-                self.log_message("No country selected", LogLevel.WARNING)
+                self.log_message("No country selected", level=LogLevel.WARNING)
                 messagebox.showerror(constants.NO_COUNTRY_SELECTED_TITLE, constants.NO_COUNTRY_SELECTED_MESSAGE)
                 return
 
             if not port or port < 1024 or port > 65535:
-                self.log_message(f"Invalid port number: {port}", LogLevel.WARNING)
+                self.log_message(f"Invalid port number: {port}", level=LogLevel.WARNING)
                 messagebox.showerror(constants.INVALID_PORT_TITLE, constants.INVALID_PORT_MESSAGE)
                 return
 
@@ -256,7 +323,7 @@ class WireproxyManager:
             proxy_instances = self.state.get_proxy_instances()
             for instance in proxy_instances:
                 if instance.port == port:
-                    self.log_message(f"Port {port} already in use", LogLevel.WARNING)
+                    self.log_message(f"Port {port} already in use", level=LogLevel.WARNING)
                     messagebox.showerror(constants.PORT_IN_USE_TITLE, constants.PORT_IN_USE_MESSAGE.format(port=port))
                     return
 
@@ -264,35 +331,35 @@ class WireproxyManager:
             try:
                 with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
                     s.bind(('127.0.0.1', port))
-                self.log_message(f"Port {port} is available", LogLevel.DEBUG)
+                self.log_message("Port %s is available", port, level=LogLevel.DEBUG)
             except OSError:
-                self.log_message(f"Port {port} is in use by another application", LogLevel.WARNING)
+                self.log_message(f"Port {port} is in use by another application", level=LogLevel.WARNING)
                 messagebox.showerror(constants.PORT_IN_USE_BY_OTHER_APP_TITLE, constants.PORT_IN_USE_BY_OTHER_APP_MESSAGE.format(port=port))
                 return
 
             # Get servers for selection
-            servers = self.state.get_servers()
-            if not servers:
-                self.log_message("No servers loaded", LogLevel.ERROR)
+            server_index = self.state.get_server_index()
+            if not server_index[0]:
+                self.log_message("No servers loaded", level=LogLevel.ERROR)
                 messagebox.showerror(constants.SERVERS_NOT_LOADED_TITLE, constants.SERVERS_NOT_LOADED_MESSAGE)
                 return
 
-            country_servers = ServerManager.get_servers_by_selection(servers, country)
+            country_servers = ServerManager.get_servers_by_selection(server_index, country)
             if not country_servers:
-                self.log_message(f"No servers found for {country}", LogLevel.ERROR)
+                self.log_message(f"No servers found for {country}", level=LogLevel.ERROR)
                 messagebox.showerror(constants.NO_SERVERS_FOUND_TITLE, constants.NO_SERVERS_FOUND_MESSAGE.format(country=country))
                 return
 
             chosen_server = ServerManager.select_best_server(country_servers)
             if not chosen_server:
-                self.log_message(f"Could not select server for {country}", LogLevel.ERROR)
+                self.log_message(f"Could not select server for {country}", level=LogLevel.ERROR)
                 messagebox.showerror(constants.COULD_NOT_SELECT_SERVER_TITLE, constants.COULD_NOT_SELECT_SERVER_MESSAGE.format(country=country))
                 return
 
             self.log_message(
                 f"Selected server {chosen_server['location']} with "
                 f"{chosen_server.get('load', 'unknown')}% load",
-                LogLevel.INFO
+                level=LogLevel.INFO
             )
 
             # Create proxy instance
@@ -310,28 +377,28 @@ class WireproxyManager:
 
             self.log_message(
                 f"Added proxy: {country} - {chosen_server['location']} on port {port}",
-                LogLevel.INFO
+                level=LogLevel.INFO
             )
 
             # Auto-increment port
             self.main_window.port_var.set(port + 1)
 
             # Save state
-            StateManager.save_state(self.state, self.settings)
+            self.request_state_save()
 
         except Exception as e:
-            self.log_message(f"Error adding proxy: {str(e)}", LogLevel.ERROR)
+            self.log_message(f"Error adding proxy: {str(e)}", level=LogLevel.ERROR)
             messagebox.showerror(constants.ADD_PROXY_ERROR_TITLE, constants.ADD_PROXY_ERROR_MESSAGE.format(error=str(e)))
 
     def remove_proxy(self):
         """Remove selected proxy with proper cleanup"""
         try:
-            if not self.main_window or not self.main_window.proxy_listbox:
+            if not self.main_window or not self.main_window.proxy_tree:
                 return
 
-            selection = self.main_window.proxy_listbox.curselection()
+            selection = self.main_window.get_selected_indices()
             if not selection:
-                self.log_message("No proxy selected for removal", LogLevel.WARNING)
+                self.log_message("No proxy selected for removal", level=LogLevel.WARNING)
                 messagebox.showwarning(constants.REMOVE_PROXY_WARNING_TITLE, constants.REMOVE_PROXY_WARNING_MESSAGE)
                 return
 
@@ -339,38 +406,38 @@ class WireproxyManager:
             instance = self.state.get_proxy_instance(index)
 
             if not instance:
-                self.log_message(f"Invalid proxy index: {index}", LogLevel.ERROR)
+                self.log_message(f"Invalid proxy index: {index}", level=LogLevel.ERROR)
                 return
 
-            self.log_message(f"Removing proxy on port {instance.port} ({instance.country})", LogLevel.INFO)
+            self.log_message(f"Removing proxy on port {instance.port} ({instance.country})", level=LogLevel.INFO)
 
             # Stop if running
             if instance.status == ProxyStatus.RUNNING:
-                self.log_message("Stopping running proxy before removal", LogLevel.DEBUG)
+                self.log_message("Stopping running proxy before removal", level=LogLevel.DEBUG)
                 self._stop_proxy_by_index(index)
 
             # Remove from state
             removed_instance = self.state.remove_proxy_instance(index)
             if removed_instance:
                 self.gui_queue.put_proxy_list_update()
-                self.log_message(f"Successfully removed proxy on port {removed_instance.port}", LogLevel.INFO)
+                self.log_message(f"Successfully removed proxy on port {removed_instance.port}", level=LogLevel.INFO)
 
                 # Save state
-                StateManager.save_state(self.state, self.settings)
+                self.request_state_save()
 
         except Exception as e:
-            self.log_message(f"Error removing proxy: {str(e)}", LogLevel.ERROR)
+            self.log_message(f"Error removing proxy: {str(e)}", level=LogLevel.ERROR)
             messagebox.showerror(constants.REMOVE_PROXY_ERROR_TITLE, constants.REMOVE_PROXY_ERROR_MESSAGE.format(error=str(e)))
 
     def start_proxy(self):
         """Start selected proxy with comprehensive error handling"""
         try:
-            if not self.main_window or not self.main_window.proxy_listbox:
+            if not self.main_window or not self.main_window.proxy_tree:
                 return
 
-            selection = self.main_window.proxy_listbox.curselection()
+            selection = self.main_window.get_selected_indices()
             if not selection:
-                self.log_message("No proxy selected for start operation", LogLevel.WARNING)
+                self.log_message("No proxy selected for start operation", level=LogLevel.WARNING)
                 messagebox.showwarning(constants.START_PROXY_WARNING_TITLE, constants.START_PROXY_WARNING_MESSAGE)
                 return
 
@@ -378,24 +445,24 @@ class WireproxyManager:
             self._start_proxy_by_index(index)
 
         except Exception as e:
-            self.log_message(f"Error starting proxy: {str(e)}", LogLevel.ERROR)
+            self.log_message(f"Error starting proxy: {str(e)}", level=LogLevel.ERROR)
             messagebox.showerror(constants.START_PROXY_ERROR_TITLE, constants.START_PROXY_ERROR_MESSAGE.format(error=str(e)))
 
     def _start_proxy_by_index(self, index: int):
         """Start proxy by index"""
         instance = self.state.get_proxy_instance(index)
         if not instance:
-            self.log_message(f"Invalid proxy index: {index}", LogLevel.ERROR)
+            self.log_message(f"Invalid proxy index: {index}", level=LogLevel.ERROR)
             return
 
         if instance.status == ProxyStatus.RUNNING:
-            self.log_message(f"Proxy on port {instance.port} is already running", LogLevel.WARNING)
+            self.log_message(f"Proxy on port {instance.port} is already running", level=LogLevel.WARNING)
             return
 
         # Check keys
         private_key, public_key = self.state.get_keys()
         if not private_key or not public_key:
-            self.log_message("WireGuard keys not configured", LogLevel.ERROR)
+            self.log_message("WireGuard keys not configured", level=LogLevel.ERROR)
             messagebox.showerror(constants.WIREGUARD_KEYS_NOT_CONFIGURED_TITLE, constants.WIREGUARD_KEYS_NOT_CONFIGURED_MESSAGE)
             return
 
@@ -403,26 +470,20 @@ class WireproxyManager:
         self.state.update_proxy_status(index, ProxyStatus.STARTING)
         instance.connection_attempts += 1
 
-        # Force immediate GUI update
-        if self.main_window:
-            self.main_window.update_proxy_list_display()
-
         try:
             # Generate configurations
-            wg_config = ConfigurationManager.generate_wireguard_config(instance.server, private_key)
-            wireproxy_config = ConfigurationManager.generate_wireproxy_config(wg_config, instance.port)
+            wireproxy_config = self._get_wireproxy_config(instance, private_key)
 
             # Start process
             process_info = ProcessManager.start_wireproxy_process(
                 wireproxy_config, 
                 self.state, 
-                parent_window=self.main_window.root if self.main_window else None
+                parent_window=self.main_window.root if self.main_window else None,
+                on_download_finished=lambda: self._start_proxy_instance(instance)
             )
 
             if not process_info:
                 self.state.update_proxy_status(index, ProxyStatus.ERROR)
-                if self.main_window:
-                    self.main_window.update_proxy_list_display()
                 return
 
             # Store process info and update status
@@ -430,50 +491,74 @@ class WireproxyManager:
             self.state.update_proxy_status(index, ProxyStatus.RUNNING)
             instance.start_time = datetime.now()
 
-            # Force GUI update
-            if self.main_window:
-                self.main_window.update_proxy_list_display()
-
             # Save state
-            StateManager.save_state(self.state, self.settings)
+            self.request_state_save()
 
-            self.log_message(f"Successfully started proxy on port {instance.port}", LogLevel.INFO)
+            self.log_message(f"Successfully started proxy on port {instance.port}", level=LogLevel.INFO)
 
             # Test connection in background
             self.thread_pool.submit(self._test_proxy_connection, instance.port)
 
         except Exception as e:
             self.state.update_proxy_status(index, ProxyStatus.ERROR)
-            if self.main_window:
-                self.main_window.update_proxy_list_display()
-            self.log_message(f"Error starting proxy: {str(e)}", LogLevel.ERROR)
+            self.log_message(f"Error starting proxy: {str(e)}", level=LogLevel.ERROR)
+
+    def _start_proxy_instance(self, instance: ProxyInstance):
+        """Start a proxy found by identity, for callbacks that may run after the list changed"""
+        for index, current in enumerate(self.state.get_proxy_instances()):
+            if current is instance:
+                self._start_proxy_by_index(index)
+                return
+        self.log_message("Proxy on port %s was removed before it could start", instance.port, level=LogLevel.INFO)
+
+    @staticmethod
+    def _get_wireproxy_config(instance: ProxyInstance, private_key: str) -> str:
+        """Return the wireproxy config for an instance, generating it only once"""
+        if instance.cached_config is None:
+            wg_config = ConfigurationManager.generate_wireguard_config(instance.server, private_key)
+            instance.cached_config = ConfigurationManager.generate_wireproxy_config(wg_config, instance.port)
+        return instance.cached_config
 
     def _test_proxy_connection(self, port: int):
         """Test proxy connection (runs in background)"""
-        time.sleep(2)  # Wait for proxy to be ready
+        if self.shutdown_event.wait(2):  # Wait for proxy to be ready
+            return
         try:
-            sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-            sock.settimeout(5)
-            result = sock.connect_ex(('127.0.0.1', port))
-            sock.close()
-
-            if result == 0:
-                self.log_message(f"Proxy on port {port} is accepting connections", LogLevel.INFO)
+            if self._probe_port_nonblocking(port):
+                self.log_message(f"Proxy on port {port} is accepting connections", level=LogLevel.INFO)
             else:
-                self.log_message(f"Proxy on port {port} is not accepting connections", LogLevel.WARNING)
+                self.log_message(f"Proxy on port {port} is not accepting connections", level=LogLevel.WARNING)
 
         except Exception as e:
-            self.log_message(f"Could not test proxy connection: {str(e)}", LogLevel.WARNING)
+            self.log_message(f"Could not test proxy connection: {str(e)}", level=LogLevel.WARNING)
+
+    @staticmethod
+    def _probe_port_nonblocking(port: int, timeout: float = 0.5) -> bool:
+        """Check whether a local port accepts connections, waiting at most `timeout` seconds"""
+        with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+            sock.setblocking(False)
+            result = sock.connect_ex(('127.0.0.1', port))
+            if result == 0:
+                return True
+            if result not in (errno.EINPROGRESS, errno.EWOULDBLOCK, errno.EAGAIN):
+                return False
+
+            with selectors.DefaultSelector() as selector:
+                selector.register(sock, selectors.EVENT_WRITE)
+                if not selector.select(timeout):
+                    return False
+
+            return sock.getsockopt(socket.SOL_SOCKET, socket.SO_ERROR) == 0
 
     def stop_proxy(self):
         """Stop selected proxy"""
         try:
-            if not self.main_window or not self.main_window.proxy_listbox:
+            if not self.main_window or not self.main_window.proxy_tree:
                 return
 
-            selection = self.main_window.proxy_listbox.curselection()
+            selection = self.main_window.get_selected_indices()
             if not selection:
-                self.log_message("No proxy selected for stop operation", LogLevel.WARNING)
+                self.log_message("No proxy selected for stop operation", level=LogLevel.WARNING)
                 messagebox.showwarning(constants.STOP_PROXY_WARNING_TITLE, constants.STOP_PROXY_WARNING_MESSAGE)
                 return
 
@@ -481,23 +566,23 @@ class WireproxyManager:
             self._stop_proxy_by_index(index)
 
             # Save state
-            StateManager.save_state(self.state, self.settings)
+            self.request_state_save()
 
         except Exception as e:
-            self.log_message(f"Error stopping proxy: {str(e)}", LogLevel.ERROR)
+            self.log_message(f"Error stopping proxy: {str(e)}", level=LogLevel.ERROR)
             messagebox.showerror(constants.STOP_PROXY_ERROR_TITLE, constants.STOP_PROXY_ERROR_MESSAGE.format(error=str(e)))
 
     def _stop_proxy_by_index(self, index: int):
         """Stop proxy by index (internal method)"""
         instance = self.state.get_proxy_instance(index)
         if not instance:
-            self.log_message(f"Invalid proxy index: {index}", LogLevel.ERROR)
+            self.log_message(f"Invalid proxy index: {index}", level=LogLevel.ERROR)
             return
 
-        self.log_message(f"Stopping proxy on port {instance.port}", LogLevel.INFO)
+        self.log_message(f"Stopping proxy on port {instance.port}", level=LogLevel.INFO)
 
         if instance.status != ProxyStatus.RUNNING:
-            self.log_message(f"Proxy on port {instance.port} is not running", LogLevel.DEBUG)
+            self.log_message("Proxy on port %s is not running", instance.port, level=LogLevel.DEBUG)
             return
 
         # Get and remove process info
@@ -513,17 +598,16 @@ class WireproxyManager:
         # Update status
         self.state.update_proxy_status(index, ProxyStatus.STOPPED)
         instance.start_time = None
-        self.gui_queue.put_proxy_list_update()
 
-        self.log_message(f"Successfully stopped proxy on port {instance.port}", LogLevel.INFO)
+        self.log_message("Successfully stopped proxy on port %s", instance.port, level=LogLevel.INFO)
 
     def stop_all_proxies(self):
         """Stop all running proxies with proper thread management"""
         proxy_instances = self.state.get_proxy_instances()
         running_count = sum(1 for instance in proxy_instances if instance.status == ProxyStatus.RUNNING)
 
-        self.log_message("Stopping all running proxies...", LogLevel.INFO)
-        self.log_message(f"Found {running_count} running proxies to stop", LogLevel.DEBUG)
+        self.log_message("Stopping all running proxies...", level=LogLevel.INFO)
+        self.log_message("Found %d running proxies to stop", running_count, level=LogLevel.DEBUG)
 
         # Submit stop tasks to thread pool
         stop_futures = []
@@ -536,9 +620,9 @@ class WireproxyManager:
         if stop_futures:
             try:
                 concurrent.futures.wait(stop_futures, timeout=10)
-                self.log_message("All proxy stop operations completed", LogLevel.INFO)
+                self.log_message("All proxy stop operations completed", level=LogLevel.INFO)
             except concurrent.futures.TimeoutError:
-                self.log_message("Some proxy stop operations timed out", LogLevel.WARNING)
+                self.log_message("Some proxy stop operations timed out", level=LogLevel.WARNING)
 
     def update_keys(self):
         """Update WireGuard keys from entries"""
@@ -550,21 +634,23 @@ class WireproxyManager:
 
         if new_private_key and new_public_key:
             self.state.set_keys(new_private_key, new_public_key)
-            self.log_message("WireGuard keys updated", LogLevel.INFO)
-            StateManager.save_state(self.state, self.settings)
+            for instance in self.state.get_proxy_instances():
+                instance.cached_config = None
+            self.log_message("WireGuard keys updated", level=LogLevel.INFO)
+            self.request_state_save()
         else:
-            self.log_message("Both private and public keys must be provided", LogLevel.WARNING)
+            self.log_message("Both private and public keys must be provided", level=LogLevel.WARNING)
             messagebox.showwarning("Warning", "Please enter both public and private keys")
 
     def export_config(self):
         """Export selected proxy config"""
         try:
-            if not self.main_window or not self.main_window.proxy_listbox:
+            if not self.main_window or not self.main_window.proxy_tree:
                 return
 
-            selection = self.main_window.proxy_listbox.curselection()
+            selection = self.main_window.get_selected_indices()
             if not selection:
-                self.log_message("No proxy selected for config export", LogLevel.WARNING)
+                self.log_message("No proxy selected for config export", level=LogLevel.WARNING)
                 messagebox.showwarning(constants.EXPORT_CONFIG_WARNING_TITLE, constants.EXPORT_CONFIG_WARNING_MESSAGE)
                 return
 
@@ -579,8 +665,7 @@ class WireproxyManager:
                 messagebox.showerror(constants.WIREGUARD_KEYS_NOT_CONFIGURED_TITLE, constants.WIREGUARD_KEYS_NOT_CONFIGURED_MESSAGE)
                 return
 
-            wg_config = ConfigurationManager.generate_wireguard_config(instance.server, private_key)
-            wireproxy_config = ConfigurationManager.generate_wireproxy_config(wg_config, instance.port)
+            wireproxy_config = self._get_wireproxy_config(instance, private_key)
 
             filename = filedialog.asksaveasfilename(
                 defaultextension=".conf",
@@ -592,21 +677,21 @@ class WireproxyManager:
                 with open(filename, 'w') as f:
                     f.write(wireproxy_config)
 
-                self.log_message(f"Config exported to {filename}", LogLevel.INFO)
+                self.log_message(f"Config exported to {filename}", level=LogLevel.INFO)
                 messagebox.showinfo(constants.EXPORT_CONFIG_SUCCESS_TITLE, constants.EXPORT_CONFIG_SUCCESS_MESSAGE.format(filename=filename))
 
         except Exception as e:
-            self.log_message(f"Error exporting config: {str(e)}", LogLevel.ERROR)
+            self.log_message(f"Error exporting config: {str(e)}", level=LogLevel.ERROR)
             messagebox.showerror(constants.EXPORT_CONFIG_ERROR_TITLE, constants.EXPORT_CONFIG_ERROR_MESSAGE.format(error=str(e)))
 
     def show_config(self):
         """Show generated config in a popup"""
         try:
-            if not self.main_window or not self.main_window.proxy_listbox:
-                self.log_message("GUI not initialized properly for show_config", LogLevel.ERROR)
+            if not self.main_window or not self.main_window.proxy_tree:
+                self.log_message("GUI not initialized properly for show_config", level=LogLevel.ERROR)
                 return
 
-            selection = self.main_window.proxy_listbox.curselection()
+            selection = self.main_window.get_selected_indices()
             if not selection:
                 messagebox.showwarning(constants.SHOW_CONFIG_WARNING_TITLE, constants.SHOW_CONFIG_WARNING_MESSAGE)
                 return
@@ -615,7 +700,7 @@ class WireproxyManager:
             instance = self.state.get_proxy_instance(index)
 
             if not instance:
-                self.log_message(f"No proxy instance found at index {index}", LogLevel.ERROR)
+                self.log_message(f"No proxy instance found at index {index}", level=LogLevel.ERROR)
                 return
 
             private_key, _ = self.state.get_keys()
@@ -623,10 +708,9 @@ class WireproxyManager:
                 messagebox.showerror(constants.WIREGUARD_KEYS_NOT_CONFIGURED_TITLE, constants.WIREGUARD_KEYS_NOT_CONFIGURED_MESSAGE)
                 return
 
-            self.log_message(f"Generating config for proxy: {instance.server.name} on port {instance.port}", LogLevel.DEBUG)
+            self.log_message("Generating config for proxy: %s on port %s", instance.server.name, instance.port, level=LogLevel.DEBUG)
             
-            wg_config = ConfigurationManager.generate_wireguard_config(instance.server, private_key)
-            wireproxy_config = ConfigurationManager.generate_wireproxy_config(wg_config, instance.port)
+            wireproxy_config = self._get_wireproxy_config(instance, private_key)
 
             # Create config display window with improved error handling
             try:
@@ -637,7 +721,6 @@ class WireproxyManager:
                 config_window.grab_set()
 
                 # Center the window
-                config_window.update_idletasks()
                 x = (config_window.winfo_screenwidth() // 2) - (700 // 2)
                 y = (config_window.winfo_screenheight() // 2) - (500 // 2)
                 config_window.geometry(f"700x500+{x}+{y}")
@@ -667,31 +750,31 @@ class WireproxyManager:
                     try:
                         config_window.clipboard_clear()
                         config_window.clipboard_append(wireproxy_config)
-                        self.log_message("Config copied to clipboard", LogLevel.INFO)
+                        self.log_message("Config copied to clipboard", level=LogLevel.INFO)
                     except Exception as copy_error:
-                        self.log_message(f"Failed to copy to clipboard: {copy_error}", LogLevel.ERROR)
+                        self.log_message(f"Failed to copy to clipboard: {copy_error}", level=LogLevel.ERROR)
 
                 ttk.Button(button_frame, text="Copy to Clipboard", 
                           command=copy_to_clipboard).pack(side="left", padx=(0, 10))
                 ttk.Button(button_frame, text="Close", 
                           command=config_window.destroy).pack(side="left")
 
-                self.log_message(f"Config window opened for {instance.server.name}", LogLevel.INFO)
+                self.log_message(f"Config window opened for {instance.server.name}", level=LogLevel.INFO)
 
             except Exception as window_error:
-                self.log_message(f"Error creating config window: {window_error}", LogLevel.ERROR)
+                self.log_message(f"Error creating config window: {window_error}", level=LogLevel.ERROR)
                 # Fallback: show config in a simple message box
                 messagebox.showinfo("Configuration", wireproxy_config[:1000] + ("..." if len(wireproxy_config) > 1000 else ""))
 
         except Exception as e:
-            self.log_message(f"Error showing config: {str(e)}", LogLevel.ERROR)
+            self.log_message(f"Error showing config: {str(e)}", level=LogLevel.ERROR)
             messagebox.showerror("Error", f"Failed to show configuration: {str(e)}")
 
     def clear_log(self):
         """Clear the log window"""
         if self.main_window and self.main_window.log_text:
             self.main_window.log_text.delete(1.0, tk.END)
-            self.log_message("Log cleared", LogLevel.INFO)
+            self.log_message("Log cleared", level=LogLevel.INFO)
 
     def save_log(self):
         """Save log to file"""
@@ -706,26 +789,55 @@ class WireproxyManager:
             )
 
             if filename:
-                with open(filename, 'w') as f:
-                    f.write(self.main_window.log_text.get(1.0, tk.END))
-
-                file_size = os.path.getsize(filename)
-                self.log_message(f"Log saved to {filename} ({file_size} bytes)", LogLevel.INFO)
-                messagebox.showinfo(constants.SAVE_LOG_SUCCESS_TITLE, constants.SAVE_LOG_SUCCESS_MESSAGE.format(filename=filename))
+                # Read the widget in line chunks on the Tk thread, write them out in the background
+                log_text = self.main_window.log_text
+                last_line = int(log_text.index(tk.END).split('.')[0])
+                chunks = [
+                    log_text.get(f"{line}.0", f"{line + 1000}.0")
+                    for line in range(1, last_line + 1, 1000)
+                ]
+                self.thread_pool.submit(self._write_log_file, filename, chunks)
 
         except Exception as e:
-            self.log_message(f"Error saving log: {str(e)}", LogLevel.ERROR)
+            self.log_message(f"Error saving log: {str(e)}", level=LogLevel.ERROR)
             messagebox.showerror(constants.SAVE_LOG_ERROR_TITLE, constants.SAVE_LOG_ERROR_MESSAGE.format(error=str(e)))
 
+    def _write_log_file(self, filename: str, chunks: List[str]):
+        """Write saved log chunks to disk (runs in background)"""
+        try:
+            with open(filename, 'w') as f:
+                f.writelines(chunks)
+
+            file_size = os.path.getsize(filename)
+            self.log_message(f"Log saved to {filename} ({file_size} bytes)", level=LogLevel.INFO)
+            self.gui_queue.put_message_box(
+                'info', constants.SAVE_LOG_SUCCESS_TITLE, constants.SAVE_LOG_SUCCESS_MESSAGE.format(filename=filename)
+            )
+
+        except Exception as e:
+            self.log_message(f"Error saving log: {str(e)}", level=LogLevel.ERROR)
+            self.gui_queue.put_message_box(
+                'error', constants.SAVE_LOG_ERROR_TITLE, constants.SAVE_LOG_ERROR_MESSAGE.format(error=str(e))
+            )
+
     def change_log_level(self):
         """Unified log level change method"""
         self.show_log_level_dialog(self.main_window.root if self.main_window else None)
 
     def show_log_level_dialog(self, parent):
-        """Show log level selection dialog"""
+        """Show log level selection dialog, reusing the window once it has been built"""
         if not parent:
             return
 
+        level_window = self._log_level_dialog
+        if level_window is not None and level_window.winfo_exists():
+            self._log_level_var.set(self.settings.log_level.value)
+            level_window.transient(parent)
+            level_window.deiconify()
+            level_window.lift()
+            level_window.grab_set()
+            return
+
         level_window = tk.Toplevel(parent)
         level_window.title("Log Level")
         level_window.geometry("300x250")
@@ -733,7 +845,6 @@ class WireproxyManager:
         level_window.grab_set()
 
         # Center the window
-        level_window.update_idletasks()
         x = (level_window.winfo_screenwidth() // 2) - (300 // 2)
         y = (level_window.winfo_screenheight() // 2) - (250 // 2)
         level_window.geometry(f"300x250+{x}+{y}")
@@ -741,6 +852,14 @@ class WireproxyManager:
         ttk.Label(level_window, text="Select Log Level:", font=("Arial", 12)).pack(pady=10)
 
         level_var = tk.IntVar(value=self.settings.log_level.value)
+        self._log_level_dialog = level_window
+        self._log_level_var = level_var
+
+        def hide_dialog():
+            level_window.grab_release()
+            level_window.withdraw()
+
+        level_window.protocol("WM_DELETE_WINDOW", hide_dialog)
 
         levels = [
             (LogLevel.DEBUG, "DEBUG - Show everything"),
@@ -761,33 +880,26 @@ class WireproxyManager:
             old_level = self.settings.log_level
             self.settings.log_level = LogLevel(level_var.get())
 
-            level_names = {
-                LogLevel.DEBUG: "DEBUG",
-                LogLevel.INFO: "INFO",
-                LogLevel.WARNING: "WARNING",
-                LogLevel.ERROR: "ERROR"
-            }
-
-            new_level_name = level_names.get(self.settings.log_level, "UNKNOWN")
+            new_level_name = self.settings.log_level.name
 
             # Update all UI labels
-            if self.main_window and hasattr(self.main_window, 'log_level_label') and self.main_window.log_level_label:
+            if self.main_window and self.main_window.log_level_label is not None:
                 self.main_window.log_level_label.config(text=new_level_name)
 
             self.log_message(
-                f"Log level changed from {level_names.get(old_level, 'UNKNOWN')} "
+                f"Log level changed from {old_level.name} "
                 f"to {new_level_name}",
-                LogLevel.INFO
+                level=LogLevel.INFO
             )
 
             StateManager.save_settings(self.settings)
-            level_window.destroy()
+            hide_dialog()
 
         # Buttons
         button_frame = ttk.Frame(level_window)
         button_frame.pack(pady=20)
 
-        ttk.Button(button_frame, text="Cancel", command=level_window.destroy).pack(side=tk.LEFT, padx=5)
+        ttk.Button(button_frame, text="Cancel", command=hide_dialog).pack(side=tk.LEFT, padx=5)
         ttk.Button(button_frame, text="Apply", command=apply_level).pack(side=tk.LEFT, padx=5)
 
     def show_preferences(self):
@@ -803,10 +915,10 @@ class WireproxyManager:
     def copy_proxy_address(self):
         """Copy the selected proxy address to the clipboard."""
         try:
-            if not self.main_window or not self.main_window.proxy_listbox:
+            if not self.main_window or not self.main_window.proxy_tree:
                 return
 
-            selection = self.main_window.proxy_listbox.curselection()
+            selection = self.main_window.get_selected_indices()
             if not selection:
                 messagebox.showwarning("Warning", "Please select a proxy to copy its address.")
                 return
@@ -820,19 +932,19 @@ class WireproxyManager:
             proxy_address = f"127.0.0.1:{instance.port}"
             self.main_window.root.clipboard_clear()
             self.main_window.root.clipboard_append(proxy_address)
-            self.log_message(f"Copied to clipboard: {proxy_address}", LogLevel.INFO)
+            self.log_message(f"Copied to clipboard: {proxy_address}", level=LogLevel.INFO)
             messagebox.showinfo("Copied", f"Proxy address {proxy_address} copied to clipboard.")
 
         except Exception as e:
-            self.log_message(f"Error copying proxy address: {str(e)}", LogLevel.ERROR)
+            self.log_message(f"Error copying proxy address: {str(e)}", level=LogLevel.ERROR)
             messagebox.showerror("Error", f"Failed to copy proxy address: {str(e)}")
 
     def check_for_updates(self):
         """Check for new versions of the application on GitHub."""
         try:
-            import requests
+            from gui.download_dialog import get_http_session
             api_url = f"https://api.github.com/repos/your-repo/releases/latest"
-            response = requests.get(api_url, timeout=10)
+            response = get_http_session().get(api_url, timeout=10)
             response.raise_for_status()
             latest_version = response.json()['tag_name']
 
@@ -846,96 +958,131 @@ class WireproxyManager:
     def auto_restart_proxies(self, auto_restart_list: List[int]):
         """Auto-restart proxies from saved state with improved error handling"""
         if not auto_restart_list:
-            self.log_message(constants.LOG_NO_PROXIES_TO_RESTART, LogLevel.INFO)
+            self.log_message(constants.LOG_NO_PROXIES_TO_RESTART, level=LogLevel.INFO)
             return
-        self.log_message(constants.LOG_STARTING_AUTO_RESTART.format(count=len(auto_restart_list)), LogLevel.INFO)
+        self.log_message(constants.LOG_STARTING_AUTO_RESTART.format(count=len(auto_restart_list)), level=LogLevel.INFO)
         self.thread_pool.submit(self._auto_restart_worker, auto_restart_list)
 
     def _auto_restart_worker(self, auto_restart_list: List[int]):
         try:
-            self.log_message(constants.LOG_AUTO_RESTART_THREAD_STARTED, LogLevel.INFO)
+            self.log_message(constants.LOG_AUTO_RESTART_THREAD_STARTED, level=LogLevel.INFO)
             if not self._wait_for_servers():
                 return
 
-            self.log_message(constants.LOG_SERVERS_LOADED_AUTO_RESTART, LogLevel.INFO)
-            successful_restarts, failed_restarts = self._restart_proxies(auto_restart_list)
-            self.log_message(
-                constants.LOG_AUTO_RESTART_COMPLETED.format(successful=successful_restarts, failed=failed_restarts),
-                LogLevel.INFO
-            )
+            self.log_message(constants.LOG_SERVERS_LOADED_AUTO_RESTART, level=LogLevel.INFO)
+            # Tk is not thread-safe; the restart timers are scheduled from the GUI thread
+            self.gui_queue.put_auto_restart(auto_restart_list)
         except Exception as e:
-            self.log_message(constants.LOG_AUTO_RESTART_WORKER_ERROR.format(error=str(e)), LogLevel.ERROR)
+            self.log_message(constants.LOG_AUTO_RESTART_WORKER_ERROR.format(error=str(e)), level=LogLevel.ERROR)
 
     def _wait_for_servers(self, max_attempts=60, delay=1) -> bool:
         for _ in range(max_attempts):
             if self.shutdown_event.is_set():
-                self.log_message(constants.LOG_SHUTDOWN_REQUESTED_AUTO_RESTART, LogLevel.INFO)
+                self.log_message(constants.LOG_SHUTDOWN_REQUESTED_AUTO_RESTART, level=LogLevel.INFO)
                 return False
-            if self.state.get_servers():
+            # Wake as soon as servers arrive; the short timeout keeps shutdown responsive
+            if self.servers_loaded_event.wait(delay):
                 return True
-            time.sleep(delay)
-        self.log_message(constants.LOG_SERVERS_NOT_LOADED_AUTO_RESTART, LogLevel.ERROR)
+        self.log_message(constants.LOG_SERVERS_NOT_LOADED_AUTO_RESTART, level=LogLevel.ERROR)
         return False
 
-    def _restart_proxies(self, auto_restart_list: List[int]) -> tuple[int, int]:
-        successful_restarts = 0
-        failed_restarts = 0
+    def _restart_proxies(self, auto_restart_list: List[int]):
+        """Stagger auto-restarts on the Tk event loop (runs on the GUI thread)"""
+        if not self.main_window or not self.main_window.root:
+            return
+        if self.shutdown_event.is_set():
+            self.log_message(constants.LOG_SHUTDOWN_REQUESTED_STOP_AUTO_RESTART, level=LogLevel.INFO)
+            return
+
+        outcome = {'successful': 0, 'failed': 0, 'remaining': len(auto_restart_list)}
         for i, index in enumerate(auto_restart_list):
-            if self.shutdown_event.is_set():
-                self.log_message(constants.LOG_SHUTDOWN_REQUESTED_STOP_AUTO_RESTART, LogLevel.INFO)
-                break
             try:
-                self.log_message(constants.LOG_AUTO_RESTARTING_PROXY.format(i=i + 1, total=len(auto_restart_list), index=index), LogLevel.INFO)
-                if self.main_window and self.main_window.root:
-                    self.main_window.root.after(0, lambda idx=index: self._start_proxy_by_index(idx))
-                    successful_restarts += 1
-                time.sleep(3)
+                self._schedule_restart(i * 3000 + 500, index, i + 1, len(auto_restart_list), outcome)
             except Exception as e:
-                failed_restarts += 1
-                self.log_message(constants.LOG_FAILED_TO_SCHEDULE_AUTO_RESTART.format(index=index, error=str(e)), LogLevel.ERROR)
-        return successful_restarts, failed_restarts
+                self.log_message(constants.LOG_FAILED_TO_SCHEDULE_AUTO_RESTART.format(index=index, error=str(e)), level=LogLevel.ERROR)
+                self._record_restart(outcome, False)
+
+    def _schedule_restart(self, delay_ms: int, index: int, position: int, total: int, outcome: dict):
+        """Start a proxy after a delay, keeping the timer cancellable until it fires"""
+        def restart():
+            self._pending_restart_ids.discard(after_id)
+            self.log_message(constants.LOG_AUTO_RESTARTING_PROXY.format(i=position, total=total, index=index), level=LogLevel.INFO)
+            self._start_proxy_by_index(index)
+            instance = self.state.get_proxy_instance(index)
+            self._record_restart(outcome, instance is not None and instance.status == ProxyStatus.RUNNING)
+
+        after_id = self.main_window.root.after(delay_ms, restart)
+        self._pending_restart_ids.add(after_id)
+
+    def _record_restart(self, outcome: dict, started: bool):
+        """Count one auto-restart outcome and log the totals after the last one"""
+        outcome['successful' if started else 'failed'] += 1
+        outcome['remaining'] -= 1
+        if outcome['remaining'] == 0:
+            self.log_message(
+                constants.LOG_AUTO_RESTART_COMPLETED.format(successful=outcome['successful'], failed=outcome['failed']),
+                level=LogLevel.INFO
+            )
 
     def on_closing(self):
         """Handle application shutdown with proper cleanup"""
-        self.log_message("Application shutting down...", LogLevel.INFO)
+        self.log_message("Application shutting down...", level=LogLevel.INFO)
 
-        # Signal shutdown to monitoring thread
+        # Signal shutdown to monitoring thread, and wake the state saver so it exits
         self.shutdown_event.set()
+        self._save_requested.set()
 
-        # Save state before stopping proxies
-        StateManager.save_state(self.state, self.settings)
+        # Abort auto-restarts that have not fired yet
+        if self.main_window and self.main_window.root:
+            for after_id in list(self._pending_restart_ids):
+                self.main_window.root.after_cancel(after_id)
+        self._pending_restart_ids.clear()
+
+        # Let an in-flight debounced save finish so it can't race the final write
+        if self._saver_thread and self._saver_thread.is_alive():
+            self._saver_thread.join(timeout=2)
+
+        # Snapshot state before stopping proxies; the file is written in the background
+        save_future = StateManager.save_state_async(self.state, self.settings, self.thread_pool)
 
         # Stop all proxies with timeout
         proxy_instances = self.state.get_proxy_instances()
         running_count = sum(1 for instance in proxy_instances if instance.status == ProxyStatus.RUNNING)
 
         if running_count > 0:
-            self.log_message(f"Stopping {running_count} running proxies...", LogLevel.INFO)
+            self.log_message(f"Stopping {running_count} running proxies...", level=LogLevel.INFO)
             self.stop_all_proxies()
 
+        # Make sure the state write landed before tearing down
+        if save_future is not None:
+            try:
+                save_future.result(timeout=2)
+            except concurrent.futures.TimeoutError:
+                self.log_message("Saving state did not finish in time", level=LogLevel.WARNING)
+
         # Wait for monitor thread to finish
         if self.monitor_thread and self.monitor_thread.is_alive():
             self.monitor_thread.join(timeout=5)
             if self.monitor_thread.is_alive():
-                self.log_message("Monitor thread did not finish cleanly", LogLevel.WARNING)
+                self.log_message("Monitor thread did not finish cleanly", level=LogLevel.WARNING)
 
         # Shutdown thread pool
         try:
             self.thread_pool.shutdown(wait=True, cancel_futures=True)
         except Exception as e:
-            self.log_message(f"Error shutting down thread pool: {e}", LogLevel.WARNING)
+            self.log_message(f"Error shutting down thread pool: {e}", level=LogLevel.WARNING)
 
         # Clean up temp files
         StateManager.cleanup_temp_files(self.state)
 
-        self.log_message("Application shutdown complete", LogLevel.INFO)
+        self.log_message("Application shutdown complete", level=LogLevel.INFO)
 
         if self.main_window and self.main_window.root:
             self.main_window.root.destroy()
 
     def run_headless(self):
         """Run the application in headless mode."""
-        self.log_message("Running in headless mode.", LogLevel.INFO)
+        self.log_message("Running in headless mode.", level=LogLevel.INFO)
         StateManager.cleanup_temp_files(self.state)
         self.start_monitoring()
         self.load_servers()
@@ -950,7 +1097,7 @@ class WireproxyManager:
             while not self.shutdown_event.is_set():
                 time.sleep(1)
         except KeyboardInterrupt:
-            self.log_message("Received keyboard interrupt, shutting down...", LogLevel.INFO)
+            self.log_message("Received keyboard interrupt, shutting down...", level=LogLevel.INFO)
         finally:
             self.on_closing()
             self._cleanup()
@@ -961,10 +1108,10 @@ class WireproxyManager:
             self._initialize_app()
             self._run_main_loop()
         except KeyboardInterrupt:
-            self.log_message("Received keyboard interrupt, shutting down...", LogLevel.INFO)
+            self.log_message("Received keyboard interrupt, shutting down...", level=LogLevel.INFO)
             self.on_closing()
         except Exception as e:
-            self.log_message(f"Unexpected error in main loop: {str(e)}", LogLevel.ERROR)
+            self.log_message(f"Unexpected error in main loop: {str(e)}", level=LogLevel.ERROR)
             logger.exception("Unexpected error in main loop")
             raise
         finally:
@@ -987,33 +1134,32 @@ class WireproxyManager:
         self.start_monitoring()
         self.load_servers()
         if self.main_window.root:
-            self.main_window.root.after(3000, self._delayed_state_load)
             self.process_gui_messages()
+            self._status_tick()
 
     def _log_startup_info(self):
         if not self.settings.start_minimized:
-            self.log_message("=" * 60, LogLevel.INFO)
-            self.log_message(constants.LOG_APP_STARTED, LogLevel.INFO)
-            self.log_message(constants.LOG_PYTHON_VERSION.format(version=sys.version), LogLevel.INFO)
-            self.log_message(constants.LOG_PLATFORM.format(platform=os.name), LogLevel.INFO)
-            self.log_message(constants.LOG_WORKING_DIR.format(directory=os.getcwd()), LogLevel.INFO)
-            self.log_message("=" * 60, LogLevel.INFO)
+            self.log_message("=" * 60, level=LogLevel.INFO)
+            self.log_message(constants.LOG_APP_STARTED, level=LogLevel.INFO)
+            self.log_message(constants.LOG_PYTHON_VERSION.format(version=sys.version), level=LogLevel.INFO)
+            self.log_message(constants.LOG_PLATFORM.format(platform=os.name), level=LogLevel.INFO)
+            self.log_message(constants.LOG_WORKING_DIR.format(directory=os.getcwd()), level=LogLevel.INFO)
+            self.log_message("=" * 60, level=LogLevel.INFO)
 
     def _delayed_state_load(self):
-        if self._wait_for_servers(max_attempts=1, delay=0):
-            if not self.settings.start_minimized:
-                self.log_message(constants.LOG_SERVERS_LOADED_NOW_LOADING_STATE, LogLevel.INFO)
-            auto_restart_list = StateManager.load_state(self.state)
-            if self.main_window:
-                self.main_window.update_gui_with_loaded_keys()
-            self.gui_queue.put_proxy_list_update()
-            if self.settings.auto_start_proxies and auto_restart_list:
-                self.auto_restart_proxies(auto_restart_list)
-        else:
-            if not self.settings.start_minimized:
-                self.log_message(constants.LOG_SERVERS_NOT_LOADED_RETRY, LogLevel.WARNING)
-            if self.main_window and self.main_window.root and not self.shutdown_event.is_set():
-                self.main_window.root.after(2000, self._delayed_state_load)
+        """Load the saved state once, when the first server list reaches the GUI"""
+        if self._state_loaded or not self.servers_loaded_event.is_set():
+            return
+        self._state_loaded = True
+
+        if not self.settings.start_minimized:
+            self.log_message(constants.LOG_SERVERS_LOADED_NOW_LOADING_STATE, level=LogLevel.INFO)
+        auto_restart_list = StateManager.load_state(self.state)
+        if self.main_window:
+            self.main_window.update_gui_with_loaded_keys()
+        self.gui_queue.put_proxy_list_update()
+        if self.settings.auto_start_proxies and auto_restart_list:
+            self.auto_restart_proxies(auto_restart_list)
 
     def _run_main_loop(self):
         if self.settings.start_minimized:
@@ -34,6 +34,11 @@ ADD_PROXY_BUTTON = "+ Add Proxy"
 RELOAD_SERVERS_BUTTON = "🔄 Reload Servers"
 PREFERENCES_BUTTON = "⚙️ Preferences"
 ACTIVE_PROXIES_FRAME_TITLE = "Active Proxies"
+PROXY_COLUMN_STATUS = "Status"
+PROXY_COLUMN_PORT = "Port"
+PROXY_COLUMN_LOCATION = "Location"
+PROXY_COLUMN_LOAD = "Load"
+PROXY_COLUMN_RUNTIME = "Runtime"
 START_BUTTON = "▶ Start"
 STOP_BUTTON = "⏹ Stop"
 REMOVE_BUTTON = "🗑 Remove"
@@ -164,7 +169,6 @@ LOG_FAILED_TO_SCHEDULE_AUTO_RESTART = "Failed to schedule auto-restart for proxy
 LOG_AUTO_RESTART_COMPLETED = "Auto-restart completed: {successful} successful, {failed} failed"
 LOG_AUTO_RESTART_WORKER_ERROR = "Auto-restart worker error: {error}"
 LOG_SERVERS_LOADED_NOW_LOADING_STATE = "Servers loaded, now loading state..."
-LOG_SERVERS_NOT_LOADED_RETRY = "Servers not loaded yet, retrying in 2 seconds..."
 
 # Status Messages
 STATUS_LOADING_SERVERS = "Loading servers..."
@@ -3,23 +3,41 @@
 import tkinter as tk
 from tkinter import ttk, messagebox
 import threading
+import concurrent.futures
 import time
-import urllib.request
-import urllib.error
-import json
 import platform
 import tarfile
 import tempfile
 import os
 import hashlib
 import logging
-from typing import Optional, Callable
+from typing import Optional, Callable, Tuple
 
+import requests
+from requests.adapters import HTTPAdapter
+
+from processes.manager import ProcessManager
 import constants
 
 logger = logging.getLogger(__name__)
 
 
+def _create_http_session() -> requests.Session:
+    """Create the keep-alive session shared by GitHub release checks and downloads"""
+    session = requests.Session()
+    session.mount('https://', HTTPAdapter(pool_connections=4, pool_maxsize=8))
+    session.headers['User-Agent'] = f'{constants.APP_NAME}/{constants.APP_VERSION}'
+    return session
+
+
+_http_session = _create_http_session()
+
+
+def get_http_session() -> requests.Session:
+    """Return the shared GitHub HTTP session"""
+    return _http_session
+
+
 class DownloadProgressDialog:
     """Non-blocking download dialog with progress bar and cancellation"""
     
@@ -59,7 +77,6 @@ class DownloadProgressDialog:
         self.dialog.protocol("WM_DELETE_WINDOW", self._on_close)
         
         # Center the dialog
-        self.dialog.update_idletasks()
         x = (self.dialog.winfo_screenwidth() // 2) - (500 // 2)
         y = (self.dialog.winfo_screenheight() // 2) - (250 // 2)
         self.dialog.geometry(f"500x250+{x}+{y}")
@@ -119,6 +136,11 @@ class DownloadProgressDialog:
         if self.on_cancel:
             self.on_cancel()
             
+    def abort(self):
+        """Stop the download and close the dialog without user interaction (GUI thread only)"""
+        self.cancel_event.set()
+        self._close_dialog()
+
     def _close_dialog(self):
         """Close the dialog"""
         if self.dialog:
@@ -210,23 +232,21 @@ class DownloadProgressDialog:
         try:
             self._update_status("Connecting to GitHub...")
             
-            # Create request with proper headers
-            headers = {
-                'User-Agent': f'{constants.APP_NAME}/{constants.APP_VERSION}',
-                'Accept': 'application/octet-stream'
-            }
-            
-            req = urllib.request.Request(download_url, headers=headers)
-            
             # Check if cancelled before starting
             if self.cancel_event.is_set():
                 return
                 
             # Open connection
             try:
-                response = urllib.request.urlopen(req, timeout=30)
-            except urllib.error.URLError as e:
-                error_msg = f"Connection failed: {e.reason}"
+                response = _http_session.get(
+                    download_url,
+                    headers={'Accept': 'application/octet-stream'},
+                    timeout=30,
+                    stream=True
+                )
+                response.raise_for_status()
+            except requests.exceptions.RequestException as e:
+                error_msg = f"Connection failed: {e}"
                 logger.error(error_msg)
                 self._download_complete(False, error_msg)
                 return
@@ -245,18 +265,10 @@ class DownloadProgressDialog:
             chunk_size = 8192
             
             try:
-                with open(output_path, 'wb') as f:
-                    while True:
+                with response, open(output_path, 'wb') as f:
+                    for chunk in response.iter_content(chunk_size):
                         if self.cancel_event.is_set():
                             logger.info("Download cancelled by user")
-                            try:
-                                os.unlink(output_path)
-                            except OSError:
-                                pass
-                            return
-                            
-                        chunk = response.read(chunk_size)
-                        if not chunk:
                             break
                             
                         f.write(chunk)
@@ -270,9 +282,18 @@ class DownloadProgressDialog:
                 logger.error(error_msg)
                 self._download_complete(False, error_msg)
                 return
+            except requests.exceptions.RequestException as e:
+                error_msg = f"Download interrupted: {e}"
+                logger.error(error_msg)
+                self._download_complete(False, error_msg)
+                return
                 
             # Verify download
             if self.cancel_event.is_set():
+                try:
+                    os.unlink(output_path)
+                except OSError:
+                    pass
                 return
                 
             self._update_status("Verifying download...")
@@ -354,15 +375,13 @@ class WireproxyDownloadManager:
         try:
             logger.info("Fetching latest wireproxy release info...")
             
-            headers = {
-                'User-Agent': f'{constants.APP_NAME}/{constants.APP_VERSION}',
-                'Accept': 'application/vnd.github.v3+json'
-            }
-            
-            req = urllib.request.Request(constants.GITHUB_API_URL, headers=headers)
-            
-            with urllib.request.urlopen(req, timeout=10) as response:
-                release_data = json.loads(response.read().decode())
+            response = _http_session.get(
+                constants.GITHUB_API_URL,
+                headers={'Accept': 'application/vnd.github.v3+json'},
+                timeout=10
+            )
+            response.raise_for_status()
+            release_data = response.json()
                 
             latest_version = release_data.get('tag_name', 'unknown')
             logger.info(f"Latest wireproxy version: {latest_version}")
@@ -439,18 +458,27 @@ class WireproxyDownloadManager:
         return result
         
     @staticmethod
-    def download_wireproxy_with_ui(parent: tk.Tk, on_complete: Optional[Callable[[bool, str], None]] = None):
-        """Download wireproxy with progress dialog"""
+    def download_wireproxy_with_ui(parent: tk.Tk, on_complete: Optional[Callable[[bool, str], None]] = None
+                                   ) -> "concurrent.futures.Future[Tuple[bool, str]]":
+        """Download wireproxy with progress dialog; the returned future resolves to (success, message)"""
         logger.info("Starting wireproxy download with UI...")
+
+        future: concurrent.futures.Future = concurrent.futures.Future()
+
+        def complete(success: bool, message: str):
+            # The caller may have cancelled the future after giving up on the download
+            if not future.done() and future.set_running_or_notify_cancel():
+                future.set_result((success, message))
+            if on_complete:
+                on_complete(success, message)
         
         try:
             # Validate parent window
             if not parent or not hasattr(parent, 'winfo_exists') or not parent.winfo_exists():
                 error_msg = "Invalid parent window for download dialog"
                 logger.error(error_msg)
-                if on_complete:
-                    on_complete(False, error_msg)
-                return
+                complete(False, error_msg)
+                return future
                 
             # Detect platform
             logger.info("Detecting platform and architecture...")
@@ -464,9 +492,8 @@ class WireproxyDownloadManager:
             if not release_data:
                 error_msg = "Failed to get release information"
                 logger.error(error_msg)
-                if on_complete:
-                    on_complete(False, error_msg)
-                return
+                complete(False, error_msg)
+                return future
             
             # Find download URL
             logger.info("Finding download URL...")
@@ -475,9 +502,8 @@ class WireproxyDownloadManager:
             if not download_url:
                 error_msg = f"No download URL found for {filename}"
                 logger.error(error_msg)
-                if on_complete:
-                    on_complete(False, error_msg)
-                return
+                complete(False, error_msg)
+                return future
                 
             logger.info(f"Download URL: {download_url}")
             
@@ -492,15 +518,32 @@ class WireproxyDownloadManager:
             if not download_dialog.dialog:
                 error_msg = "Failed to create download dialog"
                 logger.error(error_msg)
-                if on_complete:
-                    on_complete(False, error_msg)
-                return
-            
+                complete(False, error_msg)
+                return future
+            
+            def on_abandoned(done: concurrent.futures.Future):
+                # The caller gave up (e.g. timed out): stop streaming so nothing is extracted later
+                if done.cancelled():
+                    logger.info("Download abandoned by caller, cancelling")
+                    download_dialog.abort()
+
+            future.add_done_callback(on_abandoned)
+
             def on_success():
                 """Handle successful download"""
+                if future.cancelled():
+                    # Finished after the caller gave up; don't replace the binary behind its back
+                    try:
+                        os.unlink(temp_file)
+                    except OSError:
+                        pass
+                    return
                 try:
                     # Extract executable
                     if WireproxyDownloadManager.extract_wireproxy_executable(temp_file, exe_name):
+                        # The new binary may live somewhere other than the cached location
+                        ProcessManager.invalidate_cache()
+
                         # Clean up temp file
                         try:
                             os.unlink(temp_file)
@@ -509,8 +552,7 @@ class WireproxyDownloadManager:
                             
                         logger.info("wireproxy download and extraction completed successfully")
                         
-                        if on_complete:
-                            on_complete(True, exe_name)
+                        complete(True, exe_name)
                             
                         # Show success message
                         messagebox.showinfo(
@@ -523,8 +565,7 @@ class WireproxyDownloadManager:
                         error_msg = "Failed to extract wireproxy executable"
                         logger.error(error_msg)
                         
-                        if on_complete:
-                            on_complete(False, error_msg)
+                        complete(False, error_msg)
                             
                         messagebox.showerror(
                             constants.DOWNLOAD_ERROR_TITLE,
@@ -535,8 +576,7 @@ class WireproxyDownloadManager:
                     error_msg = f"Post-download processing failed: {e}"
                     logger.exception("Post-download processing error")
                     
-                    if on_complete:
-                        on_complete(False, error_msg)
+                    complete(False, error_msg)
                         
                     messagebox.showerror(
                         constants.DOWNLOAD_ERROR_TITLE,
@@ -553,8 +593,7 @@ class WireproxyDownloadManager:
                 except OSError:
                     pass
                     
-                if on_complete:
-                    on_complete(False, error_msg)
+                complete(False, error_msg)
                     
                 messagebox.showerror(
                     constants.DOWNLOAD_ERROR_TITLE,
@@ -573,8 +612,7 @@ class WireproxyDownloadManager:
                 except OSError:
                     pass
                     
-                if on_complete:
-                    on_complete(False, "Download cancelled by user")
+                complete(False, "Download cancelled by user")
                     
             # Start download
             download_dialog.start_download(
@@ -589,10 +627,11 @@ class WireproxyDownloadManager:
             error_msg = f"Failed to initiate download: {e}"
             logger.exception("Download initiation error")
             
-            if on_complete:
-                on_complete(False, error_msg)
+            complete(False, error_msg)
                 
             messagebox.showerror(
                 constants.DOWNLOAD_ERROR_TITLE,
                 error_msg
-            )
\ No newline at end of file
+            )
+
+        return future
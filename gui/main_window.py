@@ -6,8 +6,10 @@ import tkinter as tk
 from tkinter import ttk, messagebox, scrolledtext, filedialog  # noqa: F401  (kept intentionally)
 import threading  # noqa: F401  (kept intentionally)
 import webbrowser  # noqa: F401  (kept intentionally)
+from collections import deque
 from datetime import datetime, timedelta
-from typing import Optional, List
+from itertools import zip_longest
+from typing import Optional, List, Tuple
 
 from models import LogLevel, ProxyStatus
 from gui.queue import GUIMessageQueue  # noqa: F401  (kept intentionally)
@@ -29,13 +31,6 @@ class MainWindow:
 
     # ---- Class-level constants / shared mappings ---------------------------------
 
-    _LOG_LEVEL_NAMES = {
-        LogLevel.DEBUG: "DEBUG",
-        LogLevel.INFO: "INFO",
-        LogLevel.WARNING: "WARNING",
-        LogLevel.ERROR: "ERROR",
-    }
-
     _LOG_LEVEL_NAMES_ABBREV = {
         LogLevel.DEBUG: "DEBUG",
         LogLevel.INFO: "INFO",
@@ -43,6 +38,8 @@ class MainWindow:
         LogLevel.ERROR: "ERROR",
     }
 
+    _PROXY_COLUMNS = ("status", "port", "location", "load", "runtime")
+
     _STATUS_ICONS = {
         ProxyStatus.RUNNING: "[RUNNING]",
         ProxyStatus.STARTING: "[STARTING]",
@@ -63,9 +60,10 @@ class MainWindow:
         self.root: Optional[tk.Tk] = None
         self.country_var: Optional[tk.StringVar] = None
         self.port_var: Optional[tk.IntVar] = None
-        self.proxy_listbox: Optional[tk.Listbox] = None
+        self.proxy_tree: Optional[ttk.Treeview] = None
         self.log_text: Optional[scrolledtext.ScrolledText] = None
         self.status_label: Optional[ttk.Label] = None
+        self.status_var: Optional[tk.StringVar] = None
         self.private_key_entry: Optional[ttk.Entry] = None
         self.public_key_entry: Optional[ttk.Entry] = None
         self.country_combo: Optional[ttk.Combobox] = None
@@ -73,6 +71,13 @@ class MainWindow:
 
         # Flag to prevent UI updates during resize operations
         self._updating_ui = False
+        self._resize_after_id: Optional[str] = None
+
+        # Rendered (text, colour) per proxy list row, used to rewrite only changed rows
+        self._proxy_rows_cache: List[Tuple[Tuple[str, ...], str]] = []
+        self._proxy_list_refresh_pending = False
+        # Log lines waiting to be written to the log widget by flush_log_display()
+        self._log_buffer: deque = deque(maxlen=2000)
 
     # ---- GUI creation -------------------------------------------------------------
 
@@ -109,8 +114,8 @@ class MainWindow:
 
             return self.root
         except tk.TclError as e:
-            self.app_manager.log_message(f"Failed to create GUI: {e}", LogLevel.ERROR)
-            self.app_manager.log_message("Running in headless mode.", LogLevel.INFO)
+            self.app_manager.log_message(f"Failed to create GUI: {e}", level=LogLevel.ERROR)
+            self.app_manager.log_message("Running in headless mode.", level=LogLevel.INFO)
             # Fallback: create a withdrawn root so dependent code can still call into tk safely.
             try:
                 self.root = tk.Tk()
@@ -141,9 +146,8 @@ class MainWindow:
         if self.log_text:
             update_scrolledtext_theme(self.log_text)
 
-        # Special handling for Listbox with scrollbar.
-        if self.proxy_listbox:
-            theme_manager.configure_widget(self.proxy_listbox)
+        # Row colours come from the theme; a refresh reconfigures the status tags.
+        self.update_proxy_list_display()
 
         # Apply dark title bar if in dark mode.
         if theme_manager.is_dark_mode():
@@ -158,12 +162,12 @@ class MainWindow:
         wireproxy_path = ProcessManager.find_wireproxy_executable()
 
         if not wireproxy_path:
-            self.app_manager.log_message("wireproxy executable not found during startup", LogLevel.WARNING)
+            self.app_manager.log_message("wireproxy executable not found during startup", level=LogLevel.WARNING)
             # Show a non-blocking warning with download option after UI settles.
             if self.root:
                 self.root.after(1000, self._show_wireproxy_missing_dialog)
         else:
-            self.app_manager.log_message(f"wireproxy executable found at: {wireproxy_path}", LogLevel.INFO)
+            self.app_manager.log_message(f"wireproxy executable found at: {wireproxy_path}", level=LogLevel.INFO)
 
     def _show_wireproxy_missing_dialog(self) -> None:
         """Show dialog about missing wireproxy with download option."""
@@ -182,11 +186,11 @@ class MainWindow:
             )
 
             if result:
-                self.app_manager.log_message("User chose to download wireproxy at startup", LogLevel.INFO)
+                self.app_manager.log_message("User chose to download wireproxy at startup", level=LogLevel.INFO)
 
                 def on_download_complete(success: bool, message: str) -> None:
                     if success:
-                        self.app_manager.log_message("wireproxy downloaded successfully at startup", LogLevel.INFO)
+                        self.app_manager.log_message("wireproxy downloaded successfully at startup", level=LogLevel.INFO)
                         messagebox.showinfo(
                             "Download Complete",
                             "wireproxy has been downloaded successfully!\n\nYou can now create proxies.",
@@ -194,12 +198,12 @@ class MainWindow:
                         )
                     else:
                         self.app_manager.log_message(
-                            f"wireproxy download failed at startup: {message}", LogLevel.ERROR
+                            f"wireproxy download failed at startup: {message}", level=LogLevel.ERROR
                         )
 
                 WireproxyDownloadManager.download_wireproxy_with_ui(self.root, on_complete=on_download_complete)
             else:
-                self.app_manager.log_message("User chose to continue without wireproxy at startup", LogLevel.INFO)
+                self.app_manager.log_message("User chose to continue without wireproxy at startup", level=LogLevel.INFO)
                 messagebox.showinfo(
                     "wireproxy Missing",
                     "You can download wireproxy later through:\n\n"
@@ -210,7 +214,7 @@ class MainWindow:
                 )
 
         except ImportError as e:
-            self.app_manager.log_message(f"Failed to import download dialog at startup: {e}", LogLevel.ERROR)
+            self.app_manager.log_message(f"Failed to import download dialog at startup: {e}", level=LogLevel.ERROR)
             # Fallback to simple error message
             messagebox.showerror(
                 constants.MISSING_DEPENDENCY_TITLE,
@@ -343,23 +347,37 @@ class MainWindow:
 
         # Configure grid weights
         left_frame.columnconfigure(0, weight=1)
-        left_frame.rowconfigure(0, weight=1)  # Listbox area - expandable
+        left_frame.rowconfigure(0, weight=1)  # Proxy list area - expandable
         left_frame.rowconfigure(1, weight=0)  # Button area - fixed
 
-        # Listbox container
-        listbox_container = ttk.Frame(left_frame)
-        listbox_container.grid(row=0, column=0, sticky=(tk.W, tk.E, tk.N, tk.S), pady=(0, 10))
-        listbox_container.columnconfigure(0, weight=1)
-        listbox_container.columnconfigure(1, weight=0)  # Scrollbar column
-        listbox_container.rowconfigure(0, weight=1)
-
-        # Listbox - REMOVED width=35
-        self.proxy_listbox = tk.Listbox(listbox_container, exportselection=False)
-        self.proxy_listbox.grid(row=0, column=0, sticky=(tk.W, tk.E, tk.N, tk.S))
-
-        scrollbar = ttk.Scrollbar(listbox_container, orient="vertical", command=self.proxy_listbox.yview)
+        # Proxy list container
+        tree_container = ttk.Frame(left_frame)
+        tree_container.grid(row=0, column=0, sticky=(tk.W, tk.E, tk.N, tk.S), pady=(0, 10))
+        tree_container.columnconfigure(0, weight=1)
+        tree_container.columnconfigure(1, weight=0)  # Scrollbar column
+        tree_container.rowconfigure(0, weight=1)
+
+        # Treeview only lays out visible rows, so long proxy lists stay responsive
+        self.proxy_tree = ttk.Treeview(
+            tree_container,
+            columns=self._PROXY_COLUMNS,
+            show="headings",
+            selectmode="browse",
+        )
+        for column, heading, width, anchor in (
+            ("status", constants.PROXY_COLUMN_STATUS, 90, tk.W),
+            ("port", constants.PROXY_COLUMN_PORT, 60, tk.CENTER),
+            ("location", constants.PROXY_COLUMN_LOCATION, 200, tk.W),
+            ("load", constants.PROXY_COLUMN_LOAD, 60, tk.CENTER),
+            ("runtime", constants.PROXY_COLUMN_RUNTIME, 80, tk.CENTER),
+        ):
+            self.proxy_tree.heading(column, text=heading)
+            self.proxy_tree.column(column, width=width, minwidth=40, anchor=anchor, stretch=(column == "location"))
+        self.proxy_tree.grid(row=0, column=0, sticky=(tk.W, tk.E, tk.N, tk.S))
+
+        scrollbar = ttk.Scrollbar(tree_container, orient="vertical", command=self.proxy_tree.yview)
         scrollbar.grid(row=0, column=1, sticky=(tk.N, tk.S))
-        self.proxy_listbox.configure(yscrollcommand=scrollbar.set)
+        self.proxy_tree.configure(yscrollcommand=scrollbar.set)
 
         self._create_proxy_buttons_frame(left_frame)
 
@@ -436,8 +454,9 @@ class MainWindow:
             btn = ttk.Button(log_btn_container, text=text, command=command)
             btn.grid(row=0, column=i, padx=(0, 5) if i < len(button_configs) - 1 else (0, 10), sticky=(tk.W, tk.E))
 
-        current_level_name = self._LOG_LEVEL_NAMES.get(self.app_manager.settings.log_level, "UNKNOWN")
-        self.log_level_label = ttk.Label(log_btn_container, text=current_level_name, font=self._LOG_LEVEL_FONT)
+        self.log_level_label = ttk.Label(
+            log_btn_container, text=self.app_manager.settings.log_level.name, font=self._LOG_LEVEL_FONT
+        )
         self.log_level_label.grid(row=0, column=3, sticky=tk.E)
 
     def _create_status_bar(self, parent: ttk.Frame) -> None:
@@ -446,7 +465,8 @@ class MainWindow:
         status_container.grid(row=4, column=0, sticky=(tk.W, tk.E))
         status_container.columnconfigure(0, weight=1)
 
-        self.status_label = ttk.Label(status_container, text=constants.STATUS_LABEL_DEFAULT, relief="sunken")
+        self.status_var = tk.StringVar(value=constants.STATUS_LABEL_DEFAULT)
+        self.status_label = ttk.Label(status_container, textvariable=self.status_var, relief="sunken")
         theme_manager = get_theme_manager()
         theme_manager.configure_widget(self.status_label)
         self.status_label.grid(row=0, column=0, sticky=(tk.W, tk.E), pady=(10, 0))
@@ -461,7 +481,7 @@ class MainWindow:
                 self.root.minsize(self._MIN_WIDTH, self._MIN_HEIGHT)
 
             # Throttle UI updates during resize
-            if hasattr(self, '_resize_after_id'):
+            if self._resize_after_id is not None:
                 self.root.after_cancel(self._resize_after_id)
             self._resize_after_id = self.root.after(100, self._handle_resize_complete)
 
@@ -472,7 +492,7 @@ class MainWindow:
             if self.root:
                 self.root.update_idletasks()
         except Exception as e:
-            self.app_manager.log_message(f"Error handling resize: {e}", LogLevel.DEBUG)
+            self.app_manager.log_message("Error handling resize: %s", e, level=LogLevel.DEBUG)
 
     def _on_minimize(self, event: Optional[tk.Event] = None) -> None:
         """Handle minimize-to-tray behavior if enabled in settings."""
@@ -488,9 +508,15 @@ class MainWindow:
     # ---- UI updates from controller ----------------------------------------------
 
     def update_log_display(self, message: str, level: LogLevel) -> None:
-        """Update log display (called from main thread only)."""
+        """Queue a log line for the next flush (called from main thread only)."""
         if not self.log_text or level.value < self.app_manager.settings.log_level.value:
             return
+        self._log_buffer.append((level, self._timestamp_now(), message))
+
+    def flush_log_display(self) -> None:
+        """Write all buffered log lines to the log widget in a single insert."""
+        if not self._log_buffer or not self.log_text:
+            return
 
         # Prevent updates during UI operations that might cause crashes
         if self._updating_ui:
@@ -499,19 +525,21 @@ class MainWindow:
         try:
             self._updating_ui = True
 
-            timestamp = self._timestamp_now()
-            level_name = self._LOG_LEVEL_NAMES_ABBREV.get(level, "INFO")
-
-            # Get color from theme manager
             theme_manager = get_theme_manager()
-            color = theme_manager.get_log_level_color(level_name)
-
-            tag_name = f"level_{level.value}"
-            # Configure the tag once per level (safe to reconfigure).
-            self.log_text.tag_configure(tag_name, foreground=color)
-
-            log_entry = f"[{timestamp}] [{level_name:5}] {message}\n"
-            self.log_text.insert(tk.END, log_entry, tag_name)
+            configured = set()
+            insert_args: List[str] = []
+            while self._log_buffer:
+                level, timestamp, message = self._log_buffer.popleft()
+                level_name = self._LOG_LEVEL_NAMES_ABBREV.get(level, "INFO")
+                tag_name = f"level_{level.value}"
+                if tag_name not in configured:
+                    # Configure each tag once per flush (safe to reconfigure).
+                    self.log_text.tag_configure(tag_name, foreground=theme_manager.get_log_level_color(level_name))
+                    configured.add(tag_name)
+                insert_args.append(f"[{timestamp}] [{level_name:5}] {message}\n")
+                insert_args.append(tag_name)
+
+            self.log_text.insert(tk.END, *insert_args)
             self.log_text.see(tk.END)
 
         except Exception as e:
@@ -522,36 +550,49 @@ class MainWindow:
 
     def update_status_display(self, message: str) -> None:
         """Update status display (called from main thread only)."""
-        if self.status_label and not self._updating_ui:
+        if self.status_var and not self._updating_ui:
             try:
-                self.status_label.config(text=f"Status: {message}")
+                text = f"Status: {message}"
+                # Only touch the label when the text actually changes
+                if self.status_var.get() != text:
+                    self.status_var.set(text)
             except Exception:
                 pass
 
     def update_proxy_list_display(self) -> None:
-        """Update proxy list with robust error handling."""
-        if not self.proxy_listbox or self._updating_ui:
+        """Schedule a proxy list refresh; requests made before the next idle run are coalesced."""
+        if not self.proxy_tree or not self.root or self._proxy_list_refresh_pending:
+            return
+
+        self._proxy_list_refresh_pending = True
+        self.root.after_idle(self._refresh_proxy_list)
+
+    def get_selected_indices(self) -> Tuple[int, ...]:
+        """Return the indices of the selected proxies, like Listbox.curselection()."""
+        if not self.proxy_tree:
+            return ()
+        return tuple(sorted(int(iid) for iid in self.proxy_tree.selection()))
+
+    def _refresh_proxy_list(self) -> None:
+        """Rewrite only the proxy list rows whose values or status changed."""
+        if self.proxy_tree and self._updating_ui:
+            # Another UI update is in progress; try again once it has finished
+            self.root.after_idle(self._refresh_proxy_list)
+            return
+        self._proxy_list_refresh_pending = False
+        if not self.proxy_tree:
             return
 
         try:
             self._updating_ui = True
 
-            # Save current selection
-            current_selection = self.proxy_listbox.curselection()
-            current_size = self.proxy_listbox.size()
-
             proxy_instances = self.app_manager.state.get_proxy_instances()
             running_processes = self.app_manager.state.get_running_processes()
 
-            # Only update if size changed or forced
-            if current_size != len(proxy_instances):
-                self.proxy_listbox.delete(0, tk.END)
-                need_full_update = True
-            else:
-                need_full_update = False
-
             theme_manager = get_theme_manager()
 
+            new_rows: List[Tuple[Tuple[str, ...], str]] = []
+            configured_tags = set()
             for i, instance in enumerate(proxy_instances):
                 # Check actual process status with better error handling
                 actual_status = instance.status
@@ -564,53 +605,60 @@ class MainWindow:
                             self.app_manager.state.update_proxy_status(i, ProxyStatus.STOPPED)
                             self.app_manager.state.remove_running_process(i)
                     except Exception as e:
-                        self.app_manager.log_message(f"Error checking process status: {e}", LogLevel.ERROR)
+                        self.app_manager.log_message("Error checking process status: %s", e, level=LogLevel.ERROR)
                         actual_status = ProxyStatus.ERROR
 
-                # Create display text
+                # Create display values
                 status_icon = self._STATUS_ICONS.get(actual_status, "[UNKNOWN]")
                 load = instance.server.get("load", "unknown")
 
                 # Calculate runtime string
                 runtime = self._format_runtime(instance.start_time) if actual_status == ProxyStatus.RUNNING else ""
 
-                text = (
-                    f"{status_icon} Port {instance.port} - {instance.country} "
-                    f"({instance.location}) - Load: {load}%{runtime}"
+                values = (
+                    status_icon,
+                    str(instance.port),
+                    f"{instance.country} ({instance.location})",
+                    f"{load}%",
+                    runtime,
                 )
 
-                if need_full_update:
-                    self.proxy_listbox.insert(tk.END, text)
-                else:
-                    # Update existing item if text changed
+                # Add color coding using theme colors, one tag per status
+                tag_name = f"status_{actual_status.name.lower()}"
+                if tag_name not in configured_tags:
                     try:
-                        current_text = self.proxy_listbox.get(i)
-                        if current_text != text:
-                            self.proxy_listbox.delete(i)
-                            self.proxy_listbox.insert(i, text)
-                    except tk.TclError:
-                        # Item doesn't exist, insert it
-                        self.proxy_listbox.insert(tk.END, text)
-
-                # Add color coding using theme colors
-                try:
-                    status_color = theme_manager.get_status_color(actual_status.value)
-                    self.proxy_listbox.itemconfig(i, {"fg": status_color})
-                except Exception:
-                    # Color setting is non-critical
-                    pass
-
-            # Restore selection
-            if current_selection:
-                for index in current_selection:
-                    if index < self.proxy_listbox.size():
-                        try:
-                            self.proxy_listbox.selection_set(index)
-                        except Exception:
-                            pass
+                        self.proxy_tree.tag_configure(tag_name, foreground=theme_manager.get_status_color(actual_status.value))
+                    except Exception:
+                        # Color setting is non-critical
+                        pass
+                    configured_tags.add(tag_name)
+
+                new_rows.append((values, tag_name))
+
+            # Row iids are the proxy indices, so updated rows keep their selection
+            for i, (old_row, new_row) in enumerate(zip_longest(self._proxy_rows_cache, new_rows)):
+                if new_row is None:
+                    break
+                if old_row == new_row:
+                    continue
+
+                if old_row is None:
+                    self.proxy_tree.insert("", tk.END, iid=str(i), values=new_row[0], tags=(new_row[1],))
+                else:
+                    self.proxy_tree.item(str(i), values=new_row[0], tags=(new_row[1],))
+
+            if len(self._proxy_rows_cache) > len(new_rows):
+                self.proxy_tree.delete(*(str(i) for i in range(len(new_rows), len(self._proxy_rows_cache))))
+            self._proxy_rows_cache = new_rows
 
         except Exception as e:
-            self.app_manager.log_message(f"Error updating proxy list display: {e}", LogLevel.ERROR)
+            # Resynchronise from scratch on the next refresh
+            self._proxy_rows_cache = []
+            try:
+                self.proxy_tree.delete(*self.proxy_tree.get_children())
+            except tk.TclError:
+                pass
+            self.app_manager.log_message("Error updating proxy list display: %s", e, level=LogLevel.ERROR)
         finally:
             self._updating_ui = False
 
@@ -648,7 +696,7 @@ class MainWindow:
 
     @staticmethod
     def _format_runtime(start_time: Optional[datetime]) -> str:
-        """Return a human-readable runtime like ' [mm:ss]' or ' [hh:mm:ss]'."""
+        """Return a human-readable runtime like 'mm:ss' or 'hh:mm:ss'."""
         if not start_time:
             return ""
         try:
@@ -657,7 +705,7 @@ class MainWindow:
             hours, remainder = divmod(total_seconds, 3600)
             minutes, seconds = divmod(remainder, 60)
             if hours > 0:
-                return f" [{hours:02d}:{minutes:02d}:{seconds:02d}]"
-            return f" [{minutes:02d}:{seconds:02d}]"
+                return f"{hours:02d}:{minutes:02d}:{seconds:02d}"
+            return f"{minutes:02d}:{seconds:02d}"
         except Exception:
-            return " [??:??]"
\ No newline at end of file
+            return "??:??"
\ No newline at end of file
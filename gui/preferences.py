@@ -30,11 +30,12 @@ class PreferencesWindow:
         self.app_manager = app_manager
         self.preferences_window = None
         self.prefs_log_level_label = None
+        self._wireproxy_status_frame = None
 
     def show(self):
         """Show preferences window with improved structure"""
         # Reuse existing window if available
-        if hasattr(self, 'preferences_window') and self.preferences_window and self.preferences_window.winfo_exists():
+        if self.preferences_window is not None and self.preferences_window.winfo_exists():
             self.preferences_window.lift()
             self.preferences_window.focus_set()
             return
@@ -43,7 +44,7 @@ class PreferencesWindow:
         def close_window():
             """Properly cleanup window"""
             try:
-                if hasattr(self, 'preferences_window') and self.preferences_window:
+                if self.preferences_window is not None:
                     self.preferences_window.grab_release()
                     self.preferences_window.destroy()
             except tk.TclError:
@@ -149,7 +150,6 @@ class PreferencesWindow:
 
     def _center_window(self, window, width, height):
         """Center a window on screen"""
-        window.update_idletasks()
         screen_width = window.winfo_screenwidth()
         screen_height = window.winfo_screenheight()
         x = (screen_width // 2) - (width // 2)
@@ -244,13 +244,7 @@ class PreferencesWindow:
 
         ttk.Label(level_frame, text="Current log level:").pack(side="left")
 
-        level_names = {
-            LogLevel.DEBUG: "DEBUG",
-            LogLevel.INFO: "INFO",
-            LogLevel.WARNING: "WARNING",
-            LogLevel.ERROR: "ERROR"
-        }
-        current_level = level_names.get(self.app_manager.settings.log_level, "UNKNOWN")
+        current_level = self.app_manager.settings.log_level.name
 
         # Store reference to the label so it can be updated later
         self.prefs_log_level_label = ttk.Label(level_frame, text=current_level,
@@ -293,11 +287,25 @@ class PreferencesWindow:
     def _create_wireproxy_status_display(self, parent, current_wireproxy):
         status_frame = ttk.Frame(parent)
         status_frame.pack(fill="x", pady=(0, 10))
+        self._wireproxy_status_frame = status_frame
+        self._fill_wireproxy_status(status_frame, current_wireproxy)
+
+    def _fill_wireproxy_status(self, status_frame, current_wireproxy):
         if current_wireproxy:
             self._display_wireproxy_found(status_frame, current_wireproxy)
         else:
             self._display_wireproxy_not_found(status_frame)
 
+    def _refresh_wireproxy_section(self):
+        """Rebuild only the wireproxy status display instead of reopening the whole window"""
+        status_frame = self._wireproxy_status_frame
+        if not status_frame or not status_frame.winfo_exists():
+            return
+        for child in status_frame.winfo_children():
+            child.destroy()
+        self._fill_wireproxy_status(status_frame, ProcessManager.find_wireproxy_executable())
+        self._apply_theme_to_preferences()
+
     def _display_wireproxy_found(self, parent, current_wireproxy):
         ttk.Label(parent, text=constants.WIREDPROXY_STATUS_LABEL, font=("Arial", 9, "bold")).pack(side="left")
         ttk.Label(parent, text=constants.WIREDPROXY_FOUND_STATUS, foreground=get_theme_manager().get_color("success_fg"), font=("Arial", 9, "bold")).pack(side="left")
@@ -319,13 +327,25 @@ class PreferencesWindow:
             self._display_wireproxy_detail(parent, constants.WIREDPROXY_MODIFIED_LABEL, mod_time.strftime("%Y-%m-%d %H:%M:%S"))
         except Exception:
             pass
-        try:
-            result = subprocess.run([current_wireproxy, '--version'], capture_output=True, text=True, timeout=5)
-            if result.returncode == 0 and result.stdout.strip():
-                version_text = result.stdout.strip().replace('\n', ' ')[:50]
+        self._probe_wireproxy_version(parent, current_wireproxy)
+
+    def _probe_wireproxy_version(self, parent, current_wireproxy):
+        """Run `wireproxy --version` in the background and show the result when it arrives"""
+        def show_version(version_text):
+            if parent.winfo_exists():
                 self._display_wireproxy_detail(parent, constants.WIREDPROXY_VERSION_LABEL, version_text)
-        except Exception:
-            pass
+                self._apply_theme_to_preferences()
+
+        def probe():
+            try:
+                result = subprocess.run([current_wireproxy, '--version'], capture_output=True, text=True, timeout=5)
+                if result.returncode == 0 and result.stdout.strip():
+                    version_text = result.stdout.strip().replace('\n', ' ')[:50]
+                    self.app_manager.gui_queue.put_callback(show_version, version_text)
+            except Exception:
+                pass
+
+        self.app_manager.thread_pool.submit(probe)
 
     def _display_wireproxy_detail(self, parent, label, value):
         frame = ttk.Frame(parent)
@@ -350,65 +370,45 @@ class PreferencesWindow:
 
     def _download_latest_wireproxy(self):
         """Download latest wireproxy version with improved progress feedback"""
-        self.app_manager.log_message("Starting wireproxy download from preferences...", LogLevel.INFO)
+        self.app_manager.log_message("Starting wireproxy download from preferences...", level=LogLevel.INFO)
         
         if not DOWNLOAD_DIALOG_AVAILABLE:
-            self.app_manager.log_message("Download dialog not available, using fallback method", LogLevel.WARNING)
+            self.app_manager.log_message("Download dialog not available, using fallback method", level=LogLevel.WARNING)
             self._download_wireproxy_fallback()
             return
             
         try:
             def on_download_complete(success: bool, message: str):
                 if success:
-                    self.app_manager.log_message("Latest wireproxy downloaded successfully from preferences", LogLevel.INFO)
-                    # Refresh the preferences window to show updated status
+                    self.app_manager.log_message("Latest wireproxy downloaded successfully from preferences", level=LogLevel.INFO)
+                    # Refresh the wireproxy status to show the new binary
                     try:
-                        if hasattr(self, 'preferences_window') and self.preferences_window and self.preferences_window.winfo_exists():
-                            self.preferences_window.destroy()
-                            # Delay showing the updated window slightly
-                            self.parent.after(100, self.show)
+                        self._refresh_wireproxy_section()
                     except Exception as refresh_error:
-                        self.app_manager.log_message(f"Error refreshing preferences window: {refresh_error}", LogLevel.WARNING)
+                        self.app_manager.log_message(f"Error refreshing preferences window: {refresh_error}", level=LogLevel.WARNING)
                 else:
-                    self.app_manager.log_message(f"Failed to download wireproxy from preferences: {message}", LogLevel.ERROR)
+                    self.app_manager.log_message(f"Failed to download wireproxy from preferences: {message}", level=LogLevel.ERROR)
                     
             # Use the new download dialog
-            self.app_manager.log_message("Using modern download dialog for wireproxy download", LogLevel.DEBUG)
+            self.app_manager.log_message("Using modern download dialog for wireproxy download", level=LogLevel.DEBUG)
             WireproxyDownloadManager.download_wireproxy_with_ui(
                 self.preferences_window,
                 on_complete=on_download_complete
             )
             
         except Exception as e:
-            self.app_manager.log_message(f"Error with modern download dialog: {str(e)}", LogLevel.ERROR)
+            self.app_manager.log_message(f"Error with modern download dialog: {str(e)}", level=LogLevel.ERROR)
             self._download_wireproxy_fallback()
     
     def _download_wireproxy_fallback(self):
-        """Fallback download method for wireproxy"""
-        try:
-            self.app_manager.log_message("Using fallback download method", LogLevel.INFO)
-            if ProcessManager._download_wireproxy_with_ui(self.preferences_window):
-                self.app_manager.log_message("Latest wireproxy downloaded successfully (fallback)", LogLevel.INFO)
-                messagebox.showinfo(constants.DOWNLOAD_SUCCESS_TITLE, constants.DOWNLOAD_SUCCESS_MESSAGE)
-                # Refresh preferences window
-                try:
-                    if hasattr(self, 'preferences_window') and self.preferences_window and self.preferences_window.winfo_exists():
-                        self.preferences_window.destroy()
-                        self.parent.after(100, self.show)
-                except Exception as refresh_error:
-                    self.app_manager.log_message(f"Error refreshing preferences window: {refresh_error}", LogLevel.WARNING)
-            else:
-                self.app_manager.log_message("Failed to download wireproxy (fallback)", LogLevel.ERROR)
-                messagebox.showerror(constants.DOWNLOAD_ERROR_TITLE, constants.DOWNLOAD_ERROR_MESSAGE)
-        except Exception as fallback_error:
-            self.app_manager.log_message(f"Fallback download also failed: {fallback_error}", LogLevel.ERROR)
-            messagebox.showerror(constants.DOWNLOAD_ERROR_TITLE, f"Download failed: {fallback_error}\n\nPlease download manually from:\n{constants.GITHUB_RELEASES_URL}")
-            messagebox.showerror(constants.DOWNLOAD_ERROR_TITLE, f"Download error: {str(e)}")
+        """Fallback when the download dialog cannot be used: point the user at a manual download"""
+        self.app_manager.log_message("Automatic wireproxy download unavailable, asking for manual download", level=LogLevel.WARNING)
+        messagebox.showerror(constants.DOWNLOAD_FAILED_TITLE, constants.DOWNLOAD_FAILED_MESSAGE)
 
     def _check_latest_version(self):
         """Check what the latest version is without downloading"""
         try:
-            self.app_manager.log_message("Checking latest wireproxy version...", LogLevel.INFO)
+            self.app_manager.log_message("Checking latest wireproxy version...", level=LogLevel.INFO)
             
             # Use the download manager to get release info
             from gui.download_dialog import WireproxyDownloadManager
@@ -418,16 +418,18 @@ class PreferencesWindow:
             published_date = release_data.get('published_at', '')
             
             if published_date:
-                try:
-                    # Handle GitHub's ISO format
-                    pub_date = datetime.fromisoformat(published_date.replace('Z', '+00:00'))
-                    date_str = pub_date.strftime("%Y-%m-%d")
-                except ValueError:
-                    date_str = published_date
+                # GitHub returns ISO 8601, which already starts with YYYY-MM-DD
+                date_str = published_date[:10]
+                if len(date_str) != 10 or date_str[4] != '-' or date_str[7] != '-':
+                    try:
+                        pub_date = datetime.fromisoformat(published_date.replace('Z', '+00:00'))
+                        date_str = pub_date.strftime("%Y-%m-%d")
+                    except ValueError:
+                        date_str = published_date
             else:
                 date_str = "unknown date"
                 
-            self.app_manager.log_message(f"Latest wireproxy version: {latest_version}", LogLevel.INFO)
+            self.app_manager.log_message(f"Latest wireproxy version: {latest_version}", level=LogLevel.INFO)
             
             messagebox.showinfo(
                 constants.LATEST_VERSION_TITLE,
@@ -435,11 +437,11 @@ class PreferencesWindow:
             )
             
         except ImportError as e:
-            self.app_manager.log_message(f"Failed to import download manager: {e}", LogLevel.ERROR)
+            self.app_manager.log_message(f"Failed to import download manager: {e}", level=LogLevel.ERROR)
             messagebox.showerror(constants.LATEST_VERSION_ERROR_TITLE, f"Failed to check version: {e}")
             
         except Exception as e:
-            self.app_manager.log_message(f"Error checking latest version: {str(e)}", LogLevel.ERROR)
+            self.app_manager.log_message(f"Error checking latest version: {str(e)}", level=LogLevel.ERROR)
             messagebox.showerror(
                 constants.LATEST_VERSION_ERROR_TITLE,
                 constants.LATEST_VERSION_ERROR_MESSAGE.format(error=str(e))
@@ -471,7 +473,7 @@ class PreferencesWindow:
         # Apply theme change immediately
         if theme_changed:
             set_dark_mode(dark_mode)
-            self.app_manager.log_message(f"Theme changed to {'dark' if dark_mode else 'light'} mode", LogLevel.INFO)
+            self.app_manager.log_message(f"Theme changed to {'dark' if dark_mode else 'light'} mode", level=LogLevel.INFO)
             
             # Apply theme to main window
             if self.app_manager.main_window:
@@ -483,17 +485,16 @@ class PreferencesWindow:
         # Persist changes
         from state import StateManager
         StateManager.save_settings(self.app_manager.settings)
-        self.app_manager.log_message("Preferences saved", LogLevel.INFO)
+        self.app_manager.log_message("Preferences saved", level=LogLevel.INFO)
 
         # Debug log to verify what was saved
         self.app_manager.log_message(
-            f"Saved: start_minimized={start_minimized}, minimize_to_tray={minimize_to_tray}, "
-            f"auto_start_proxies={auto_start_proxies}, api_endpoint={api_endpoint}",
-            LogLevel.DEBUG)
+            "Saved: start_minimized=%s, minimize_to_tray=%s, auto_start_proxies=%s, api_endpoint=%s",
+            start_minimized, minimize_to_tray, auto_start_proxies, api_endpoint, level=LogLevel.DEBUG)
 
         # Handle API endpoint change
         if api_changed:
-            self.app_manager.log_message(f"API endpoint changed to: {api_endpoint}", LogLevel.INFO)
+            self.app_manager.log_message(f"API endpoint changed to: {api_endpoint}", level=LogLevel.INFO)
             messagebox.showinfo(
                 "API Endpoint Changed",
                 "API endpoint has been updated. You may want to reload servers to test the new endpoint."
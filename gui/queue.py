@@ -1,7 +1,7 @@
 """Thread-safe message queue for GUI updates."""
 
 import queue
-from typing import List
+from typing import Any, Callable, List
 from models import LogLevel
 
 
@@ -23,6 +23,15 @@ class GUIMessageQueue:
     def put_server_update(self, country_options: List[str]):
         self.queue.put(('server_update', country_options))
 
+    def put_message_box(self, kind: str, title: str, message: str):
+        self.queue.put(('message_box', kind, title, message))
+
+    def put_auto_restart(self, indices: List[int]):
+        self.queue.put(('auto_restart', indices))
+
+    def put_callback(self, callback: Callable[..., Any], *args):
+        self.queue.put(('callback', callback, args))
+
     def get_messages(self):
         messages = []
         try:
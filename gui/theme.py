@@ -253,6 +253,18 @@ class ThemeManager:
         self._style.map("TRadiobutton",
                        background=[("active", colors["frame_bg"])],
                        foreground=[("active", colors["frame_fg"])])
+
+        # Treeview style (Active Proxies list)
+        self._style.configure("Treeview",
+                             background=colors["listbox_bg"],
+                             fieldbackground=colors["listbox_bg"],
+                             foreground=colors["listbox_fg"])
+        self._style.map("Treeview",
+                       background=[("selected", colors["listbox_select_bg"])],
+                       foreground=[("selected", colors["listbox_select_fg"])])
+        self._style.configure("Treeview.Heading",
+                             background=colors["button_bg"],
+                             foreground=colors["button_fg"])
     
     def _configure_tk_defaults(self, colors: Dict[str, str]):
         """Configure default Tkinter widget options with comprehensive coverage"""
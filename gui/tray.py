@@ -7,33 +7,43 @@ from PIL import Image, ImageDraw
 logger = logging.getLogger(__name__)
 
 
+def _make_tray_icon():
+    """Draw the tray icon image"""
+    width = 64
+    height = 64
+    image = Image.new('RGB', (width, height), color='blue')
+    draw = ImageDraw.Draw(image)
+    draw.ellipse([16, 16, 48, 48], fill='white')
+    return image
+
+
+try:
+    _TRAY_ICON = _make_tray_icon()
+except Exception as e:
+    logger.warning(f"Could not prepare tray icon image: {e}")
+    _TRAY_ICON = None
+
+
 class TrayIconManager:
     """Manages system tray icon"""
 
     def __init__(self, app_manager):
         self.app_manager = app_manager
         self.tray_icon = None
+        self._tray_started = False
 
     def create_tray_icon(self):
         """Create system tray icon"""
         try:
             import pystray
 
-            def create_icon_image():
-                width = 64
-                height = 64
-                image = Image.new('RGB', (width, height), color='blue')
-                draw = ImageDraw.Draw(image)
-                draw.ellipse([16, 16, 48, 48], fill='white')
-                return image
-
             menu = pystray.Menu(
                 pystray.MenuItem("Show", self.show_from_tray),
                 pystray.MenuItem("Preferences", self.app_manager.show_preferences),
                 pystray.MenuItem("Quit", self.quit_from_tray)
             )
 
-            self.tray_icon = pystray.Icon("wireproxy", create_icon_image(), "Wireproxy Manager", menu)
+            self.tray_icon = pystray.Icon("wireproxy", _TRAY_ICON or _make_tray_icon(), "Wireproxy Manager", menu)
         except Exception as e:
             logger.error(f"Failed to create tray icon: {e}")
             self.tray_icon = None
@@ -53,8 +63,7 @@ class TrayIconManager:
             self.app_manager.main_window and 
             self.app_manager.main_window.root):
             self.app_manager.main_window.root.withdraw()
-            if self.tray_icon and not self.tray_icon.visible:
-                threading.Thread(target=self.tray_icon.run, daemon=True).start()
+            self._ensure_tray_running()
 
     def quit_from_tray(self, icon=None, item=None):
         """Quit from tray"""
@@ -65,5 +74,12 @@ class TrayIconManager:
 
     def start_tray_if_minimized(self):
         """Start tray icon if application is set to start minimized"""
-        if self.app_manager.settings.start_minimized and self.tray_icon:
+        if self.app_manager.settings.start_minimized:
+            self._ensure_tray_running()
+
+    def _ensure_tray_running(self):
+        """Start the tray icon event loop once; later calls are no-ops"""
+        if self.tray_icon and not self._tray_started:
+            self._tray_started = True
+            # Daemon thread rather than the shared pool: run() only returns on stop()
             threading.Thread(target=self.tray_icon.run, daemon=True).start()
\ No newline at end of file
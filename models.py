@@ -1,11 +1,15 @@
 """Data models and enums for the WireProxy SurfShark GUI application."""
 
 import subprocess
+import sys
 from datetime import datetime
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass, asdict, field
 from enum import Enum
 from typing import Dict, List, Optional, Any
 
+# Drop the per-instance __dict__ where dataclasses support it (Python 3.10+)
+_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
 
 class LogLevel(Enum):
     DEBUG = 0
@@ -21,7 +25,7 @@ class ProxyStatus(Enum):
     ERROR = "Error"
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class ProxyInstance:
     id: int
     country: str
@@ -32,21 +36,38 @@ class ProxyInstance:
     created_at: datetime = None
     start_time: Optional[datetime] = None
     connection_attempts: int = 0
+    # Generated wireproxy config, reused until the keys change
+    cached_config: Optional[str] = field(default=None, repr=False, compare=False)
 
     def __post_init__(self):
         if self.created_at is None:
             self.created_at = datetime.now()
 
+    def to_dict(self, auto_restart: bool) -> Dict[str, Any]:
+        """Serialize for the saved state file"""
+        return {
+            'country': self.country,
+            'location': self.location,
+            'port': self.port,
+            'status': self.status.value,
+            'server': self.server,
+            'connection_attempts': self.connection_attempts,
+            'created_at': self.created_at.isoformat(),
+            'auto_restart': auto_restart
+        }
+
 
-@dataclass
+@dataclass(**_SLOTS)
 class ProcessInfo:
     process: subprocess.Popen
     config_file: str
     start_time: float
     high_cpu_start: Optional[float] = None
+    # Process group id on POSIX; the process leads its own session, so this equals its pid
+    pgid: Optional[int] = None
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class AppSettings:
     start_minimized: bool = False
     minimize_to_tray: bool = True
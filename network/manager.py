@@ -4,42 +4,36 @@ import json
 import time
 import logging
 import requests
-from typing import Dict, List, Optional, Any
+from requests.adapters import HTTPAdapter
+from collections import defaultdict
+from typing import Dict, List, Optional, Any, Tuple
+
+try:
+    from orjson import loads as json_loads
+except ImportError:  # orjson is optional; stdlib json also accepts bytes
+    from json import loads as json_loads
 
 logger = logging.getLogger(__name__)
 
+# (servers by country, servers by (country, normalized location))
+ServerIndex = Tuple[Dict[str, List[Dict[str, Any]]], Dict[Tuple[str, str], List[Dict[str, Any]]]]
+
+# Fields every server entry must carry for a proxy to be built from it
+_REQUIRED = frozenset(('country', 'location', 'pubKey', 'connectionName'))
+
+
+def _create_api_session() -> requests.Session:
+    """Create the keep-alive session used for SurfShark API requests"""
+    session = requests.Session()
+    # Retries are handled by fetch_servers_with_retry
+    session.mount('https://', HTTPAdapter(pool_connections=2, pool_maxsize=4, max_retries=0))
+    return session
+
 
 class NetworkManager:
     """Handles all network operations with proper error handling and retries"""
 
-    @staticmethod
-    def test_connectivity(api_endpoint: str, timeout: int = 5) -> bool:
-        """Test network connectivity with timeout"""
-        try:
-            logger.debug("Testing network connectivity...")
-            # Add more robust validation
-            response = requests.get(api_endpoint, timeout=timeout, verify=True)
-            if response.status_code == 200:
-                # Validate JSON structure
-                try:
-                    data = response.json()
-                    if isinstance(data, list) and len(data) > 0:
-                        # Basic validation that it looks like server data
-                        if 'country' in data[0] and 'location' in data[0]:
-                            logger.info("Network connectivity test passed")
-                            return True
-                except (json.JSONDecodeError, KeyError, IndexError):
-                    logger.warning("API returned invalid JSON structure")
-                    return False
-            else:
-                logger.warning(f"Network test failed with status code: {response.status_code}")
-                return False
-        except requests.exceptions.SSLError as e:
-            logger.error(f"SSL verification failed: {str(e)}")
-            return False
-        except requests.exceptions.RequestException as e:
-            logger.error(f"Network connectivity test failed: {str(e)}")
-            return False
+    _session = _create_api_session()
 
     @staticmethod
     def fetch_servers_with_retry(api_endpoint: str, max_retries: int = 3, timeout: int = 10) -> Optional[
@@ -50,36 +44,25 @@ class NetworkManager:
             try:
                 logger.debug(f"Fetching servers (attempt {attempt + 1}/{max_retries})")
 
-                if not NetworkManager.test_connectivity(api_endpoint):
-                    logger.error("Network connectivity test failed")
-                    if attempt < max_retries - 1:
-                        time.sleep(2 ** attempt)  # Exponential backoff
-                        continue
-                    return None
-
-                with requests.Session() as session:
-                    session.timeout = timeout
+                start_time = time.time()
+                response = NetworkManager._session.get(api_endpoint, timeout=timeout, verify=True)
+                end_time = time.time()
 
-                    start_time = time.time()
-                    response = session.get(api_endpoint, timeout=timeout, verify=True)
-                    end_time = time.time()
+                logger.debug(f"API request completed in {end_time - start_time:.2f} seconds")
+                response.raise_for_status()
 
-                    logger.debug(f"API request completed in {end_time - start_time:.2f} seconds")
-                    response.raise_for_status()
+                servers = json_loads(response.content)
 
-                    servers = response.json()
+                # Validate server data structure
+                if not isinstance(servers, list) or len(servers) == 0:
+                    raise ValueError("Invalid server data structure")
 
-                    # Validate server data structure
-                    if not isinstance(servers, list) or len(servers) == 0:
-                        raise ValueError("Invalid server data structure")
+                # Check required fields in first server
+                if not _REQUIRED.issubset(servers[0]):
+                    raise ValueError("Server data missing required fields")
 
-                    # Check required fields in first server
-                    required_fields = ['country', 'location', 'pubKey', 'connectionName']
-                    if not all(field in servers[0] for field in required_fields):
-                        raise ValueError("Server data missing required fields")
-
-                    logger.info(f"Successfully fetched {len(servers)} servers")
-                    return servers
+                logger.info(f"Successfully fetched {len(servers)} servers")
+                return servers
 
             except (requests.exceptions.RequestException, ValueError, json.JSONDecodeError) as e:
                 logger.error(f"Error fetching servers (attempt {attempt + 1}): {str(e)}")
@@ -99,60 +82,48 @@ class ServerManager:
     @staticmethod
     def process_servers(servers: List[Dict[str, Any]]) -> List[str]:
         """Process server data into dropdown options"""
-        countries = {}
+        countries = defaultdict(set)
         for server in servers:
-            country = server['country']
-            location = server['location']
-
-            if country not in countries:
-                countries[country] = set()
-
-            countries[country].add(location)
+            countries[server['country']].add(server['location'])
 
         # Create dropdown options
         country_options = []
-        for country in sorted(countries.keys()):
+        for country in sorted(countries):
             locations = sorted(countries[country])
 
-            if len(locations) == 1:
-                country_options.append(country)
-            else:
-                country_options.append(country)
+            country_options.append(country)
+            if len(locations) > 1:
                 for location in locations:
                     country_options.append(f"{country} - {location}")
 
         return country_options
 
     @staticmethod
-    def get_servers_by_selection(servers: List[Dict[str, Any]], selection: str) -> List[Dict[str, Any]]:
+    def build_index(servers: List[Dict[str, Any]]) -> ServerIndex:
+        """Index servers by country and by (country, normalized location)"""
+        by_country = defaultdict(list)
+        by_country_loc = defaultdict(list)
+        for server in servers:
+            country = server['country']
+            by_country[country].append(server)
+            by_country_loc[(country, server['location'].strip().lower())].append(server)
+        return dict(by_country), dict(by_country_loc)
+
+    @staticmethod
+    def get_servers_by_selection(server_index: ServerIndex, selection: str) -> List[Dict[str, Any]]:
         """Get servers based on country or country-city selection"""
+        by_country, by_country_loc = server_index
         if " - " in selection:
             # Specific city selected
-            parts = selection.split(" - ", 1)
-            if len(parts) == 2:
-                country, location = parts
-
-                # Try exact match first
-                country_servers = [
-                    server for server in servers
-                    if server['country'] == country and server['location'] == location
-                ]
-
-                # Fallback to fuzzy matching if needed
-                if not country_servers:
-                    location_clean = location.strip().lower()
-                    country_servers = [
-                        server for server in servers
-                        if (server['country'] == country and
-                            server['location'].strip().lower() == location_clean)
-                    ]
-
-                return country_servers
-        else:
-            # Whole country selected
-            return [server for server in servers if server['country'] == selection]
-
-        return []
+            country, location = selection.split(" - ", 1)
+            candidates = by_country_loc.get((country, location.strip().lower()), [])
+
+            # Prefer exact matches, fall back to the case/whitespace-insensitive ones
+            exact = [server for server in candidates if server['location'] == location]
+            return exact or list(candidates)
+
+        # Whole country selected
+        return list(by_country.get(selection, []))
 
     @staticmethod
     def select_best_server(servers: List[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
@@ -160,4 +131,13 @@ class ServerManager:
         if not servers:
             return None
 
-        return min(servers, key=lambda x: x.get('load', 100))
\ No newline at end of file
+        # Single pass without a key function; stop early on an idle server
+        best = servers[0]
+        best_load = best.get('load', 100)
+        for server in servers:
+            load = server.get('load', 100)
+            if load < best_load:
+                best, best_load = server, load
+                if load == 0:
+                    break
+        return best
\ No newline at end of file
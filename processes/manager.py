@@ -1,8 +1,12 @@
 """Process manager for handling wireproxy processes."""
 
 import os
+import sys
+import ctypes
+import errno
 import stat
 import time
+import select
 import signal
 import shutil
 import subprocess
@@ -13,8 +17,8 @@ import platform
 import tarfile
 import urllib.request
 import hashlib
-import threading
-from typing import Optional
+import concurrent.futures
+from typing import Callable, List, Optional, Set, Tuple
 try:
     import tkinter as tk
     from tkinter import messagebox
@@ -34,200 +38,304 @@ except ImportError:
     messagebox = DummyMessagebox()
 
 from models import ProcessInfo
-import constants
+from constants import (
+    DOWNLOAD_ERROR_TITLE,
+    GITHUB_RELEASES_URL,
+    MISSING_DEPENDENCY_MESSAGE,
+    MISSING_DEPENDENCY_TITLE,
+)
 
 logger = logging.getLogger(__name__)
 
+# Fixed search locations, resolved once at import
+_APP_DIR = os.path.dirname(os.path.abspath(__file__))
+_APP_SEARCH_PATH = os.pathsep.join((_APP_DIR, os.path.dirname(_APP_DIR)))
+_COMMON_INSTALL_PATH = "" if os.name == 'nt' else os.pathsep.join((
+    "/usr/local/bin",
+    "/usr/bin",
+    "/opt/wireproxy",
+    os.path.expanduser("~/.local/bin"),
+    "/snap/bin",  # Snap package
+    "/usr/local/sbin",
+    "/usr/sbin",
+))
+
+# statx(2) with AT_STATX_DONT_SYNC lets network filesystems answer from cached metadata
+_AT_FDCWD = -100
+_AT_STATX_DONT_SYNC = 0x4000
+_STATX_TYPE = 0x1
+_STATX_MODE = 0x2
+_STATX_SIZE = 0x200
+
+
+class _StatxBuf(ctypes.Structure):
+    """Leading fields of struct statx, padded to the kernel's 256-byte size"""
+    _fields_ = [
+        ("stx_mask", ctypes.c_uint32),
+        ("stx_blksize", ctypes.c_uint32),
+        ("stx_attributes", ctypes.c_uint64),
+        ("stx_nlink", ctypes.c_uint32),
+        ("stx_uid", ctypes.c_uint32),
+        ("stx_gid", ctypes.c_uint32),
+        ("stx_mode", ctypes.c_uint16),
+        ("_spare0", ctypes.c_uint16),
+        ("stx_ino", ctypes.c_uint64),
+        ("stx_size", ctypes.c_uint64),
+        ("_rest", ctypes.c_uint8 * 208),
+    ]
+
+
+_libc_statx = None
+if sys.platform.startswith('linux'):
+    try:
+        _libc_statx = ctypes.CDLL(None, use_errno=True).statx  # glibc 2.28+
+        _libc_statx.argtypes = [ctypes.c_int, ctypes.c_char_p, ctypes.c_int, ctypes.c_uint,
+                                ctypes.POINTER(_StatxBuf)]
+        _libc_statx.restype = ctypes.c_int
+    except (OSError, AttributeError):
+        _libc_statx = None
+
+
+def _stat_mode_size(path: str) -> Tuple[int, int]:
+    """Return (st_mode, st_size) for path, via statx(AT_STATX_DONT_SYNC) where available"""
+    global _libc_statx
+    if _libc_statx is not None:
+        buf = _StatxBuf()
+        wanted = _STATX_TYPE | _STATX_MODE | _STATX_SIZE
+        if _libc_statx(_AT_FDCWD, os.fsencode(path), _AT_STATX_DONT_SYNC, wanted, ctypes.byref(buf)) == 0:
+            if buf.stx_mask & wanted == wanted:
+                return buf.stx_mode, buf.stx_size
+        else:
+            err = ctypes.get_errno()
+            if err not in (errno.ENOSYS, errno.EPERM):
+                raise OSError(err, os.strerror(err), path)
+            # Kernel without statx (or a seccomp filter blocking it): stop trying
+            _libc_statx = None
+
+    st = os.stat(path)
+    return st.st_mode, st.st_size
+
+
+# Executable header magic numbers
+_PE_MAGIC = b'MZ'  # Windows PE
+_ELF_MAGIC = b'\x7fELF'  # Linux ELF
+_MACHO_MAGICS = frozenset({  # macOS Mach-O, 32/64-bit in both byte orders
+    b'\xfe\xed\xfa\xce', b'\xfe\xed\xfa\xcf',
+    b'\xce\xfa\xed\xfe', b'\xcf\xfa\xed\xfe',
+})
+
 
 class ProcessManager:
     """Manages wireproxy processes with proper lifecycle management"""
 
     @staticmethod
-    def _download_wireproxy_with_ui(parent_window=None) -> bool:
-        """Download wireproxy using the new UI dialog (deprecated - use gui.download_dialog)"""
-        try:
-            if not HAS_TKINTER or not parent_window:
-                logger.error("Cannot download wireproxy without GUI support")
-                return False
-                
-            from gui.download_dialog import WireproxyDownloadManager
-            
-            download_success = False
-            error_message = None
-            download_completed = threading.Event()
-            
-            def on_download_complete(success: bool, message: str):
-                nonlocal download_success, error_message
-                download_success = success
-                error_message = message
-                download_completed.set()
-                
-            # Start download with UI
-            WireproxyDownloadManager.download_wireproxy_with_ui(
-                parent_window, 
-                on_complete=on_download_complete
+    def _watch_download(download_future: concurrent.futures.Future, parent_window,
+                        on_finished: Optional[Callable[[], None]], timeout: float = 300):
+        """Finish a download on the Tk thread once its future resolves, without blocking that thread"""
+        timeout_id = parent_window.after(int(timeout * 1000), download_future.cancel)
+
+        def finish():
+            try:
+                parent_window.after_cancel(timeout_id)
+            except Exception:
+                pass
+            ProcessManager._finish_download(download_future, on_finished)
+
+        def on_done(_future):
+            # Done callbacks run on whichever thread resolved the future; hop back to Tk
+            try:
+                parent_window.after(0, finish)
+            except Exception:
+                logger.warning("Parent window closed before wireproxy download finished")
+
+        download_future.add_done_callback(on_done)
+
+    @staticmethod
+    def _finish_download(download_future: concurrent.futures.Future,
+                         on_finished: Optional[Callable[[], None]]):
+        """Report a finished download and resume the start that triggered it"""
+        if download_future.cancelled():
+            logger.error("wireproxy download timed out")
+            messagebox.showerror(
+                DOWNLOAD_ERROR_TITLE,
+                "Download timed out. Please try again or download manually."
             )
-            
-            # Wait for download to complete (with timeout)
-            if download_completed.wait(timeout=300):  # 5 minute timeout
-                return download_success
-            else:
-                logger.error("Download timed out")
-                return False
-                
-        except Exception as e:
-            logger.error(f"Error downloading wireproxy with UI: {e}")
-            return False
+            return
+
+        download_success, download_error = download_future.result()
+        if not download_success:
+            logger.error("wireproxy download failed: %s", download_error)
+            # Error message already shown by download dialog
+            return
+
+        logger.info("wireproxy download completed successfully")
+        # Try to find wireproxy again after download
+        if not ProcessManager.find_wireproxy_executable():
+            logger.error("wireproxy executable still not found after download")
+            messagebox.showerror(
+                "Download Issue",
+                "wireproxy was downloaded but cannot be found.\n\n"
+                "Please check the current directory and try again."
+            )
+            return
+
+        if on_finished:
+            on_finished()
+
+    # Last successful lookup and its (st_ino, st_mtime_ns, st_size), reused while the file is unchanged
+    _cached_path: Optional[str] = None
+    _cached_stat: Optional[tuple] = None
+
+    @staticmethod
+    def invalidate_cache():
+        """Forget the cached wireproxy location so the next lookup searches again"""
+        ProcessManager._cached_path = None
+        ProcessManager._cached_stat = None
+
+    @staticmethod
+    def _stat_key(path: str) -> tuple:
+        """Identify a file version by inode, modification time and size"""
+        st = os.stat(path)
+        return st.st_ino, st.st_mtime_ns, st.st_size
 
     @staticmethod
     def find_wireproxy_executable() -> Optional[str]:
+        """Find wireproxy executable, reusing the last successful lookup while the file is unchanged"""
+        cached_path = ProcessManager._cached_path
+        if cached_path:
+            try:
+                if ProcessManager._stat_key(cached_path) == ProcessManager._cached_stat:
+                    return cached_path
+            except OSError:
+                pass
+            ProcessManager.invalidate_cache()
+
+        wireproxy_path = ProcessManager._search_wireproxy_executable()
+        if wireproxy_path:
+            try:
+                ProcessManager._cached_stat = ProcessManager._stat_key(wireproxy_path)
+                ProcessManager._cached_path = wireproxy_path
+            except OSError:
+                pass
+        return wireproxy_path
+
+    @staticmethod
+    def _search_wireproxy_executable() -> Optional[str]:
         """Find wireproxy executable with comprehensive logging and validation"""
         logger.debug("Starting wireproxy executable search...")
-        
-        # Method 1: Check using shutil.which (most reliable for PATH)
+
+        # Many candidates resolve to the same file (PATH containing '.', /usr/local/bin on PATH, ...),
+        # so each absolute path is validated at most once
+        cwd = os.getcwd()
+        seen: Set[str] = set()
+        for path, location in ProcessManager._wireproxy_candidates(cwd):
+            # join() keeps absolute paths as they are; relative PATH entries resolve against cwd
+            abs_path = os.path.normpath(os.path.join(cwd, path))
+            if abs_path in seen:
+                continue
+            seen.add(abs_path)
+            if ProcessManager._check_candidate(abs_path, location):
+                logger.info("Found wireproxy in %s: %s", location, abs_path)
+                return abs_path
+
+        logger.warning("wireproxy executable not found in any searched location")
+        logger.debug("Search locations included: PATH, current directory, common Linux paths, relative paths")
+        return None
+
+    @staticmethod
+    def _check_candidate(abs_path: str, location: str) -> bool:
+        """Validate one search candidate, logging instead of raising"""
         try:
-            wireproxy_path = shutil.which("wireproxy")
-            if wireproxy_path:
-                if ProcessManager._validate_wireproxy_executable(wireproxy_path):
-                    logger.info(f"Found wireproxy using shutil.which: {wireproxy_path}")
-                    return wireproxy_path
-                else:
-                    logger.warning(f"wireproxy found via shutil.which but validation failed: {wireproxy_path}")
+            return ProcessManager._validate_wireproxy_executable(abs_path)
         except Exception as e:
-            logger.debug(f"shutil.which failed: {e}")
-
-        # Method 2: Manual PATH search with multiple executable name variants
-        path_env = os.environ.get("PATH", "")
-        logger.debug(f"Searching PATH: {path_env}")
-        
-        executable_names = ["wireproxy", "wireproxy.exe"]
-        
-        for path in path_env.split(os.pathsep):
-            if not path.strip():
-                continue
-                
-            for exe_name in executable_names:
-                potential_path = os.path.join(path, exe_name)
-                try:
-                    if os.path.isfile(potential_path) and ProcessManager._validate_wireproxy_executable(potential_path):
-                        logger.info(f"Found wireproxy in PATH: {potential_path}")
-                        return potential_path
-                except Exception as e:
-                    logger.debug(f"Error checking {potential_path}: {e}")
+            logger.debug("Error checking %s %s: %s", location, abs_path, e)
+            return False
 
-        # Method 3: Check current working directory
-        logger.debug("Checking current working directory...")
-        for exe_name in executable_names:
-            try:
-                if os.path.isfile(exe_name) and ProcessManager._validate_wireproxy_executable(exe_name):
-                    abs_path = os.path.abspath(exe_name)
-                    logger.info(f"Found wireproxy in current directory: {abs_path}")
-                    return abs_path
-            except Exception as e:
-                logger.debug(f"Error checking current directory {exe_name}: {e}")
-
-        # Method 4: Check common Linux installation paths
-        if os.name != 'nt':
-            logger.debug("Checking common Linux installation paths...")
-            common_paths = [
-                "/usr/local/bin/wireproxy",
-                "/usr/bin/wireproxy", 
-                "/opt/wireproxy/wireproxy",
-                os.path.expanduser("~/.local/bin/wireproxy"),
-                "/snap/bin/wireproxy",  # Snap package
-                "/usr/local/sbin/wireproxy",
-                "/usr/sbin/wireproxy"
-            ]
-
-            for path in common_paths:
-                try:
-                    if os.path.isfile(path) and ProcessManager._validate_wireproxy_executable(path):
-                        logger.info(f"Found wireproxy in common path: {path}")
-                        return path
-                except Exception as e:
-                    logger.debug(f"Error checking common path {path}: {e}")
-
-        # Method 5: Check relative paths and application directory
-        logger.debug("Checking relative and application-specific paths...")
-        app_dir = os.path.dirname(os.path.abspath(__file__))
-        relative_paths = [
-            "./wireproxy",
-            "./wireproxy.exe", 
-            "../wireproxy",
-            "../wireproxy.exe",
-            os.path.join(app_dir, "wireproxy"),
-            os.path.join(app_dir, "wireproxy.exe"),
-            os.path.join(app_dir, "..", "wireproxy"),
-            os.path.join(app_dir, "..", "wireproxy.exe"),
+    @staticmethod
+    def _wireproxy_candidates(cwd: str) -> List[Tuple[str, str]]:
+        """Return (path, location description) pairs in search order, one per search rung"""
+        rungs = [
+            # Method 1: PATH (shutil.which also honours PATHEXT on Windows)
+            (None, "PATH"),
+            # Method 2: Current working directory
+            (cwd, "current directory"),
         ]
-        
-        for path in relative_paths:
+
+        # Method 3: Common Linux installation paths
+        if _COMMON_INSTALL_PATH:
+            rungs.append((_COMMON_INSTALL_PATH, "common path"))
+
+        # Method 4: Relative paths and application directory
+        rungs.append((os.pathsep.join((cwd, os.path.dirname(cwd), _APP_SEARCH_PATH)), "relative path"))
+
+        candidates: List[Tuple[str, str]] = []
+        for search_path, location in rungs:
             try:
-                if os.path.isfile(path) and ProcessManager._validate_wireproxy_executable(path):
-                    abs_path = os.path.abspath(path)
-                    logger.info(f"Found wireproxy in relative path: {abs_path}")
-                    return abs_path
+                wireproxy_path = shutil.which("wireproxy", path=search_path)
+                if wireproxy_path:
+                    candidates.append((wireproxy_path, location))
             except Exception as e:
-                logger.debug(f"Error checking relative path {path}: {e}")
+                logger.debug("shutil.which failed for %s: %s", location, e)
+
+        return candidates
 
-        logger.warning("wireproxy executable not found in any searched location")
-        logger.debug("Search locations included: PATH, current directory, common Linux paths, relative paths")
-        return None
-        
     @staticmethod 
     def _validate_wireproxy_executable(path: str) -> bool:
         """Validate that a file is a valid wireproxy executable"""
         try:
-            # Check if file exists and is readable
-            if not os.path.isfile(path):
+            # One stat covers existence, type, executable bits and size
+            try:
+                st_mode, file_size = _stat_mode_size(path)
+            except OSError:
                 return False
-                
-            # Check if file is executable
-            if not os.access(path, os.X_OK):
+
+            # Check if it is a regular file
+            if not stat.S_ISREG(st_mode):
                 return False
-                
+
+            # Check if file is executable (Popen reports any real EACCES)
+            if not st_mode & (stat.S_IXUSR | stat.S_IXGRP | stat.S_IXOTH):
+                return False
+
             # Check file size (wireproxy should be at least 1MB)
-            file_size = os.path.getsize(path)
             if file_size < 1024 * 1024:  # Less than 1MB is suspicious
-                logger.debug(f"File {path} is too small ({file_size} bytes) to be wireproxy")
+                logger.debug("File %s is too small (%d bytes) to be wireproxy", path, file_size)
                 return False
                 
             # Check if it's a binary file (not a script)
             try:
-                with open(path, 'rb') as f:
-                    header = f.read(4)
-                    # Check for common executable headers
-                    if os.name == 'nt':
-                        # Windows PE header
-                        if header[:2] == b'MZ':
-                            logger.debug(f"File {path} has valid Windows PE header")
-                            return True
-                    else:
-                        # Linux ELF header
-                        if header == b'\x7fELF':
-                            logger.debug(f"File {path} has valid ELF header")
-                            return True
-                        # macOS Mach-O headers
-                        if header in [b'\xfe\xed\xfa\xce', b'\xfe\xed\xfa\xcf', 
-                                     b'\xce\xfa\xed\xfe', b'\xcf\xfa\xed\xfe']:
-                            logger.debug(f"File {path} has valid Mach-O header")
-                            return True
-                            
-                    logger.debug(f"File {path} does not have a recognized binary header: {header.hex()}")
-                    return False
+                # Raw fd read: no buffered file object needed for four bytes
+                fd = os.open(path, os.O_RDONLY | getattr(os, 'O_BINARY', 0) | getattr(os, 'O_CLOEXEC', 0))
+                try:
+                    header = os.read(fd, 4)
+                finally:
+                    os.close(fd)
+
+                # Check for common executable headers
+                if os.name == 'nt':
+                    valid = header[:2] == _PE_MAGIC
+                else:
+                    valid = header == _ELF_MAGIC or header in _MACHO_MAGICS
+                if valid:
+                    logger.debug("File %s has a valid executable header", path)
+                    return True
+
+                logger.debug("File %s does not have a recognized binary header: %r", path, header)
+                return False
                     
             except (IOError, OSError) as e:
-                logger.debug(f"Could not read file header for {path}: {e}")
+                logger.debug("Could not read file header for %s: %s", path, e)
                 # If we can't read the header, but other checks passed, assume it's valid
                 return True
                 
         except Exception as e:
-            logger.debug(f"Error validating {path}: {e}")
+            logger.debug("Error validating %s: %s", path, e)
             return False
 
     @staticmethod
-    def start_wireproxy_process(config_content: str, state, parent_window=None) -> Optional[ProcessInfo]:
-        """Start a wireproxy process with comprehensive error handling and improved UI"""
+    def start_wireproxy_process(config_content: str, state, parent_window=None,
+                                on_download_finished: Optional[Callable[[], None]] = None) -> Optional[ProcessInfo]:
+        """Start a wireproxy process; when a download is needed, return None and call on_download_finished once installed"""
         config_file = None
         try:
             # Find executable with detailed logging
@@ -261,8 +369,8 @@ class ProcessManager:
                     logger.error(f"Failed to import download dialog: {e}")
                     # Fallback to simple error message
                     messagebox.showerror(
-                        constants.MISSING_DEPENDENCY_TITLE,
-                        constants.MISSING_DEPENDENCY_MESSAGE
+                        MISSING_DEPENDENCY_TITLE,
+                        MISSING_DEPENDENCY_MESSAGE
                     )
                     return None
 
@@ -272,92 +380,40 @@ class ProcessManager:
                 if user_wants_download:
                     logger.info("User chose to download wireproxy")
                     
-                    # Track download result
-                    download_success = False
-                    download_error = None
-                    download_completed = threading.Event()
-                    
-                    def on_download_complete(success: bool, message: str):
-                        nonlocal download_success, download_error
-                        download_success = success
-                        download_error = message
-                        download_completed.set()
-                        
-                    # Start download with progress dialog
+                    # Start download with progress dialog; the start resumes from on_download_finished
                     try:
-                        WireproxyDownloadManager.download_wireproxy_with_ui(
-                            parent_window,
-                            on_complete=on_download_complete
-                        )
-                        
-                        # Wait for download to complete (with reasonable timeout)
+                        download_future = WireproxyDownloadManager.download_wireproxy_with_ui(parent_window)
+                        ProcessManager._watch_download(download_future, parent_window, on_download_finished)
                         logger.info("Waiting for wireproxy download to complete...")
-                        if download_completed.wait(timeout=300):  # 5 minute timeout
-                            if download_success:
-                                logger.info("wireproxy download completed successfully")
-                                # Try to find wireproxy again after download
-                                wireproxy_path = ProcessManager.find_wireproxy_executable()
-                                if not wireproxy_path:
-                                    logger.error("wireproxy executable still not found after download")
-                                    messagebox.showerror(
-                                        "Download Issue",
-                                        "wireproxy was downloaded but cannot be found.\n\n"
-                                        "Please check the current directory and try again."
-                                    )
-                                    return None
-                            else:
-                                logger.error(f"wireproxy download failed: {download_error}")
-                                # Error message already shown by download dialog
-                                return None
-                        else:
-                            logger.error("wireproxy download timed out")
-                            messagebox.showerror(
-                                constants.DOWNLOAD_ERROR_TITLE,
-                                "Download timed out. Please try again or download manually."
-                            )
-                            return None
-                            
                     except Exception as e:
                         logger.exception("Error during wireproxy download")
                         messagebox.showerror(
-                            constants.DOWNLOAD_ERROR_TITLE,
+                            DOWNLOAD_ERROR_TITLE,
                             f"Download failed with error: {e}\n\n"
-                            f"Please download manually from:\n{constants.GITHUB_RELEASES_URL}"
+                            f"Please download manually from:\n{GITHUB_RELEASES_URL}"
                         )
-                        return None
+                    return None
                 else:
                     logger.info("User chose not to download wireproxy")
                     messagebox.showwarning(
                         "wireproxy Required",
                         "wireproxy is required to create SOCKS5 proxies.\n\n"
                         "You can download it manually from:\n"
-                        f"{constants.GITHUB_RELEASES_URL}\n\n"
+                        f"{GITHUB_RELEASES_URL}\n\n"
                         "Place the executable in your PATH or in the same directory as this application."
                     )
                     return None
 
-            # Validate the found executable
-            if not wireproxy_path or not ProcessManager._validate_wireproxy_executable(wireproxy_path):
-                logger.error(f"wireproxy executable validation failed: {wireproxy_path}")
-                messagebox.showerror(
-                    "Invalid wireproxy Executable",
-                    "The wireproxy executable found is invalid or corrupted.\n\n"
-                    "Please download a fresh copy from:\n"
-                    f"{constants.GITHUB_RELEASES_URL}"
-                )
-                return None
-
+            # find_wireproxy_executable only returns validated paths; Popen reports anything that changed since
             logger.info(f"Using validated wireproxy executable: {wireproxy_path}")
 
-            # Create temporary config file with proper permissions
-            with tempfile.NamedTemporaryFile(mode='w', suffix='.conf', delete=False) as f:
-                f.write(config_content)
-                config_file = f.name
-                state.add_temp_file(config_file)
-
-            # Set proper permissions on Linux (readable by owner only for security)
-            if os.name != 'nt':
-                os.chmod(config_file, stat.S_IRUSR | stat.S_IWUSR)
+            # Create temporary config file; mkstemp creates it owner-only (0600) with O_CLOEXEC
+            fd, config_file = tempfile.mkstemp(suffix='.conf')
+            state.add_temp_file(config_file)
+            try:
+                os.write(fd, config_content.encode('utf-8'))
+            finally:
+                os.close(fd)
 
             logger.info(f"Created wireproxy config file: {config_file}")
 
@@ -365,58 +421,63 @@ class ProcessManager:
             cmd = [wireproxy_path, '-c', config_file]
             logger.info(f"Starting wireproxy with command: {' '.join(cmd)}")
 
-            if os.name == 'nt':
-                # Windows-specific process creation
-                process = subprocess.Popen(
-                    cmd,
-                    stdout=subprocess.DEVNULL,
-                    stderr=subprocess.DEVNULL,
-                    creationflags=subprocess.CREATE_NEW_PROCESS_GROUP
-                )
-            else:
-                # Linux/Unix-specific process creation
-                process = subprocess.Popen(
-                    cmd,
-                    stdout=subprocess.DEVNULL,
-                    stderr=subprocess.DEVNULL,
-                    start_new_session=True,  # Linux equivalent of CREATE_NEW_PROCESS_GROUP
-                    preexec_fn=os.setsid if hasattr(os, 'setsid') and os.name != 'nt' else None
-                )
-
-            # Wait a moment and check if process started successfully
-            time.sleep(0.5)
-
-            if process.poll() is not None:
-                # Process died immediately - get more info
-                exit_code = process.returncode
-                logger.error(f"wireproxy process failed to start immediately (exit code: {exit_code})")
-                
-                # Try to get some diagnostic info
+            # stderr goes to an anonymous temp file that is only read if wireproxy exits during
+            # startup; once it runs, no reader thread is needed and our handle is simply closed
+            with tempfile.TemporaryFile() as stderr_file:
+                if os.name == 'nt':
+                    # Windows-specific process creation
+                    process = subprocess.Popen(
+                        cmd,
+                        stdout=subprocess.DEVNULL,
+                        stderr=stderr_file,
+                        creationflags=subprocess.CREATE_NEW_PROCESS_GROUP
+                    )
+                else:
+                    # Linux/Unix-specific process creation
+                    process = subprocess.Popen(
+                        cmd,
+                        stdout=subprocess.DEVNULL,
+                        stderr=stderr_file,
+                        start_new_session=True  # Linux equivalent of CREATE_NEW_PROCESS_GROUP
+                    )
+
+                # Watch the process for half a second; a failed start is reported as soon as it exits
                 try:
-                    # Test the executable directly
-                    test_result = subprocess.run([wireproxy_path, '--version'], 
-                                               capture_output=True, text=True, timeout=5)
-                    if test_result.returncode != 0:
-                        logger.error(f"wireproxy version check failed: {test_result.stderr}")
-                except Exception as e:
-                    logger.error(f"Failed to test wireproxy executable: {e}")
+                    process.wait(timeout=0.5)
+                except subprocess.TimeoutExpired:
+                    pass
+
+                if process.returncode is not None:
+                    # Process died immediately - get more info
+                    exit_code = process.returncode
+                    logger.error(f"wireproxy process failed to start immediately (exit code: {exit_code})")
+                
+                    # The process has exited, so its stderr is complete
+                    try:
+                        stderr_file.seek(0)
+                        stderr_output = stderr_file.read().decode('utf-8', errors='replace').strip()
+                        if stderr_output:
+                            logger.error(f"wireproxy output: {stderr_output[-2000:]}")
+                    except Exception as e:
+                        logger.error(f"Failed to read wireproxy output: {e}")
                 
-                messagebox.showerror(
-                    "Process Start Failed",
-                    f"wireproxy process failed to start (exit code: {exit_code}).\n\n"
-                    "This could be due to:\n"
-                    "• Invalid configuration\n"
-                    "• Port already in use\n"
-                    "• Insufficient permissions\n"
-                    "• Corrupted executable\n\n"
-                    "Check the log for more details."
-                )
-                return None
+                    messagebox.showerror(
+                        "Process Start Failed",
+                        f"wireproxy process failed to start (exit code: {exit_code}).\n\n"
+                        "This could be due to:\n"
+                        "• Invalid configuration\n"
+                        "• Port already in use\n"
+                        "• Insufficient permissions\n"
+                        "• Corrupted executable\n\n"
+                        "Check the log for more details."
+                    )
+                    return None
 
             process_info = ProcessInfo(
                 process=process,
                 config_file=config_file,
-                start_time=time.time()
+                start_time=time.time(),
+                pgid=None if os.name == 'nt' else process.pid  # start_new_session makes pid == pgid
             )
 
             logger.info(f"Successfully started wireproxy process (PID: {process.pid})")
@@ -439,6 +500,37 @@ class ProcessManager:
             )
             return None
 
+    @staticmethod
+    def _process_group(process_info: ProcessInfo) -> int:
+        """Return the process group to signal, using the pgid recorded at start when available"""
+        if process_info.pgid is not None:
+            return process_info.pgid
+        return os.getpgid(process_info.process.pid)
+
+    @staticmethod
+    def _wait_for_exit(process: subprocess.Popen, timeout: float):
+        """Like process.wait(timeout), but sleeps on a pidfd where available instead of polling"""
+        pidfd = None
+        if hasattr(os, 'pidfd_open') and process.returncode is None:
+            try:
+                pidfd = os.pidfd_open(process.pid)
+            except OSError:
+                pidfd = None  # Older kernel or process already reaped
+
+        if pidfd is None:
+            process.wait(timeout=timeout)
+            return
+
+        try:
+            # The pidfd becomes readable once the process exits
+            poller = select.poll()
+            poller.register(pidfd, select.POLLIN)
+            poller.poll(timeout * 1000)
+        finally:
+            os.close(pidfd)
+        # Reap it, or raise TimeoutExpired if it is still running
+        process.wait(timeout=0)
+
     @staticmethod
     def stop_process_gracefully(process_info: ProcessInfo, timeout: int = 5) -> bool:
         """Stop a process gracefully with timeout, returns success status"""
@@ -452,7 +544,7 @@ class ProcessManager:
                 # Linux/Unix: try SIGTERM first, then SIGKILL
                 try:
                     # Send SIGTERM to the process group
-                    os.killpg(os.getpgid(process.pid), signal.SIGTERM)
+                    os.killpg(ProcessManager._process_group(process_info), signal.SIGTERM)
                 except (ProcessLookupError, OSError):
                     # Process already dead or not a process group leader
                     try:
@@ -461,7 +553,7 @@ class ProcessManager:
                         return True  # Process already dead
 
             try:
-                process.wait(timeout=timeout)
+                ProcessManager._wait_for_exit(process, timeout)
                 logger.info(f"Process {process.pid} terminated gracefully")
             except subprocess.TimeoutExpired:
                 # Force kill if timeout exceeded
@@ -471,7 +563,7 @@ class ProcessManager:
                 else:
                     try:
                         # Send SIGKILL to process group
-                        os.killpg(os.getpgid(process.pid), signal.SIGKILL)
+                        os.killpg(ProcessManager._process_group(process_info), signal.SIGKILL)
                     except (ProcessLookupError, OSError):
                         try:
                             os.kill(process.pid, signal.SIGKILL)
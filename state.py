@@ -4,105 +4,181 @@ import json
 import os
 import logging
 import threading
+import time
+import tempfile
 import contextlib
+import concurrent.futures
 from datetime import datetime
-from typing import Dict, List, Optional, Any
+from types import MappingProxyType
+from typing import Dict, List, Mapping, Optional, Any, Set, Tuple
 
 from models import AppSettings, LogLevel, ProxyInstance, ProxyStatus, ProcessInfo
 import constants
 
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to the standard library
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
+# Defaults and enum members used by the load/save paths, bound once at import
+_DEFAULT_LOG_LEVEL = LogLevel.DEBUG.value
+_DEFAULT_API = constants.API_ENDPOINT
+_RUNNING = ProxyStatus.RUNNING
+
+# Servers cache layout: a one-line {"version": ...} header, then the server array
+_CACHE_VERSION = '2.0'
+
+
+def _json_dumps(obj: Any, indent: bool = True) -> bytes:
+    """Serialize to UTF-8 JSON, using orjson when available"""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else None, default=str)
+    if indent:
+        return json.dumps(obj, indent=2, default=str).encode('utf-8')
+    return json.dumps(obj, separators=(',', ':'), default=str).encode('utf-8')
+
+
+def _atomic_write(path: str, data: bytes, fsync: bool = False):
+    """Write via a temp file and rename, so a crash never leaves the file truncated"""
+    # A unique temp name, so concurrent writers never share (and clobber) one temp file
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path) or '.',
+                                    prefix=os.path.basename(path) + '.', suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(data)
+            if fsync:
+                f.flush()
+                os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        with contextlib.suppress(OSError):
+            os.unlink(tmp_path)
+        raise
+
+
+def _json_loads(data: bytes) -> Any:
+    """Parse UTF-8 JSON, using orjson when available"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
 
 class ThreadSafeState:
     """Thread-safe state management"""
 
     def __init__(self):
-        self._lock = threading.RLock()
+        # One lock per independent field group, so e.g. registering a temp file never
+        # waits on a proxy list update. None are re-entered, so plain Locks suffice.
+        self._proxy_lock = threading.Lock()
+        self._process_lock = threading.Lock()
+        self._servers_lock = threading.Lock()
+        self._keys_lock = threading.Lock()
+        self._temp_lock = threading.Lock()
         self._proxy_instances: List[ProxyInstance] = []
         self._running_processes: Dict[int, ProcessInfo] = {}
-        self._servers: List[Dict[str, Any]] = []
+        # Read-only snapshots handed to readers, rebuilt only after a mutation
+        self._proxy_instances_view: Optional[Tuple[ProxyInstance, ...]] = None
+        self._running_processes_view: Optional[Mapping[int, ProcessInfo]] = None
+        self._server_index: Tuple[Dict, Dict] = ({}, {})
         self._client_private_key = ""
         self._client_public_key = ""
-        self._temp_files: List[str] = []  # Track all temp files for cleanup
+        self._temp_files: Set[str] = set()  # Track all temp files for cleanup
 
     @contextlib.contextmanager
     def lock(self):
-        with self._lock:
+        """Hold every state lock, in a fixed order; don't call other accessors inside"""
+        with self._proxy_lock, self._process_lock, self._servers_lock, self._keys_lock, self._temp_lock:
             yield
 
-    def get_proxy_instances(self) -> List[ProxyInstance]:
-        with self._lock:
-            return self._proxy_instances.copy()
+    def get_proxy_instances(self) -> Tuple[ProxyInstance, ...]:
+        with self._proxy_lock:
+            if self._proxy_instances_view is None:
+                self._proxy_instances_view = tuple(self._proxy_instances)
+            return self._proxy_instances_view
 
     def set_proxy_instances(self, instances: List[ProxyInstance]):
-        with self._lock:
-            self._proxy_instances = instances.copy()
+        with self._proxy_lock:
+            self._proxy_instances = list(instances)
+            self._proxy_instances_view = None
 
     def add_proxy_instance(self, instance: ProxyInstance):
-        with self._lock:
+        with self._proxy_lock:
             self._proxy_instances.append(instance)
+            self._proxy_instances_view = None
 
     def remove_proxy_instance(self, index: int) -> Optional[ProxyInstance]:
-        with self._lock:
+        with self._proxy_lock:
             if 0 <= index < len(self._proxy_instances):
+                self._proxy_instances_view = None
                 return self._proxy_instances.pop(index)
             return None
 
     def get_proxy_instance(self, index: int) -> Optional[ProxyInstance]:
-        with self._lock:
+        with self._proxy_lock:
             if 0 <= index < len(self._proxy_instances):
                 return self._proxy_instances[index]
             return None
 
     def update_proxy_status(self, index: int, status: ProxyStatus):
-        with self._lock:
+        with self._proxy_lock:
             if 0 <= index < len(self._proxy_instances):
                 self._proxy_instances[index].status = status
 
-    def get_running_processes(self) -> Dict[int, ProcessInfo]:
-        with self._lock:
-            return self._running_processes.copy()
+    def get_running_processes(self) -> Mapping[int, ProcessInfo]:
+        with self._process_lock:
+            if self._running_processes_view is None:
+                self._running_processes_view = MappingProxyType(dict(self._running_processes))
+            return self._running_processes_view
 
     def add_running_process(self, index: int, process_info: ProcessInfo):
-        with self._lock:
+        with self._process_lock:
             self._running_processes[index] = process_info
+            self._running_processes_view = None
 
     def remove_running_process(self, index: int) -> Optional[ProcessInfo]:
-        with self._lock:
+        with self._process_lock:
+            self._running_processes_view = None
             return self._running_processes.pop(index, None)
 
     def get_running_process(self, index: int) -> Optional[ProcessInfo]:
-        with self._lock:
+        with self._process_lock:
             return self._running_processes.get(index)
 
-    def get_servers(self) -> List[Dict[str, Any]]:
-        with self._lock:
-            return self._servers.copy()
+    def get_server_index(self) -> Tuple[Dict, Dict]:
+        with self._servers_lock:
+            return self._server_index
 
-    def set_servers(self, servers: List[Dict[str, Any]]):
-        with self._lock:
-            self._servers = servers.copy()
+    def set_server_index(self, server_index: Tuple[Dict, Dict]):
+        with self._servers_lock:
+            self._server_index = server_index
 
     def get_keys(self) -> tuple[str, str]:
-        with self._lock:
+        with self._keys_lock:
             return self._client_private_key, self._client_public_key
 
     def set_keys(self, private_key: str, public_key: str):
-        with self._lock:
+        with self._keys_lock:
             self._client_private_key = private_key
             self._client_public_key = public_key
 
+    def _snapshot_for_save(self) -> Tuple[List[ProxyInstance], Dict[int, ProcessInfo], str, str]:
+        """Copy everything save_state needs in one locked region, so the parts are consistent"""
+        with self._proxy_lock, self._process_lock, self._keys_lock:
+            return (list(self._proxy_instances), dict(self._running_processes),
+                    self._client_private_key, self._client_public_key)
+
     def add_temp_file(self, filepath: str):
-        with self._lock:
-            self._temp_files.append(filepath)
+        with self._temp_lock:
+            self._temp_files.add(filepath)
 
-    def get_temp_files(self) -> List[str]:
-        with self._lock:
-            return self._temp_files.copy()
+    def get_temp_files(self) -> Tuple[str, ...]:
+        with self._temp_lock:
+            return tuple(self._temp_files)
 
     def clear_temp_files(self):
-        with self._lock:
+        with self._temp_lock:
             self._temp_files.clear()
 
 
@@ -122,8 +198,7 @@ class StateManager:
                 'dark_mode': settings.dark_mode
             }
 
-            with open(constants.SETTINGS_FILE, 'w') as f:
-                json.dump(settings_dict, f, indent=2)
+            _atomic_write(constants.SETTINGS_FILE, _json_dumps(settings_dict))
 
             logger.debug("Settings saved successfully")
 
@@ -134,58 +209,60 @@ class StateManager:
     def load_settings() -> AppSettings:
         """Load application settings, create default file if it doesn't exist"""
         try:
-            if os.path.exists(constants.SETTINGS_FILE):
+            try:
                 # Load existing settings
-                with open(constants.SETTINGS_FILE, 'r') as f:
-                    settings_dict = json.load(f)
-
-                settings = AppSettings(
-                    start_minimized=settings_dict.get('start_minimized', False),
-                    minimize_to_tray=settings_dict.get('minimize_to_tray', True),
-                    auto_start_proxies=settings_dict.get('auto_start_proxies', True),
-                    log_level=LogLevel(settings_dict.get('log_level', LogLevel.DEBUG.value)),
-                    api_endpoint=settings_dict.get('api_endpoint', constants.API_ENDPOINT),
-                    dark_mode=settings_dict.get('dark_mode', False)
-                )
-
-                logger.debug("Settings loaded successfully from existing file")
-                return settings
-            else:
-                # Create default settings
+                with open(constants.SETTINGS_FILE, 'rb') as f:
+                    data = f.read()
+            except FileNotFoundError:
                 logger.info("No settings file found, creating default settings file")
-                default_settings = AppSettings()
+                return StateManager._create_default_settings()
 
-                # Save the default settings to file
-                StateManager.save_settings(default_settings)
-
-                logger.info(f"Created default settings file: {constants.SETTINGS_FILE}")
-                return default_settings
+            try:
+                settings_dict = _json_loads(data)
+            except ValueError:
+                if data.strip():
+                    # Keep the unparsable file for inspection instead of overwriting it
+                    corrupt_path = constants.SETTINGS_FILE + '.corrupt'
+                    os.replace(constants.SETTINGS_FILE, corrupt_path)
+                    logger.warning(f"Settings file is corrupt, moved it to {corrupt_path}")
+                else:
+                    logger.info("Settings file is empty, creating default settings file")
+                return StateManager._create_default_settings()
+
+            settings = AppSettings(
+                start_minimized=settings_dict.get('start_minimized', False),
+                minimize_to_tray=settings_dict.get('minimize_to_tray', True),
+                auto_start_proxies=settings_dict.get('auto_start_proxies', True),
+                log_level=LogLevel(settings_dict.get('log_level', _DEFAULT_LOG_LEVEL)),
+                api_endpoint=settings_dict.get('api_endpoint', _DEFAULT_API),
+                dark_mode=settings_dict.get('dark_mode', False)
+            )
+
+            logger.debug("Settings loaded successfully from existing file")
+            return settings
 
         except Exception as e:
+            # Leave the file alone; it exists and parses, so it may just hold a value we can't use
             logger.error(f"Error loading settings: {str(e)}")
             logger.info("Using default settings due to error")
+            return AppSettings()
 
-            # Try to create default settings file even if loading failed
-            try:
-                default_settings = AppSettings()
-                StateManager.save_settings(default_settings)
-                logger.info("Created default settings file after load error")
-                return default_settings
-            except Exception as save_error:
-                logger.error(f"Could not save default settings: {str(save_error)}")
-                return AppSettings()  # Return in-memory defaults as last resort
+    @staticmethod
+    def _create_default_settings() -> AppSettings:
+        """Write and return default settings"""
+        default_settings = AppSettings()
+        StateManager.save_settings(default_settings)
+        logger.info(f"Created default settings file: {constants.SETTINGS_FILE}")
+        return default_settings
 
     @staticmethod
     def save_servers_cache(servers: List[Dict[str, Any]]):
         """Save servers to cache file"""
         try:
-            cache_data = {
-                'servers': servers,
-                'timestamp': datetime.now().isoformat(),
-                'version': '1.0'
-            }
-            with open(constants.CACHE_FILE, 'w', encoding='utf-8') as f:
-                json.dump(cache_data, f, indent=2, default=str)
+            # One-line header followed by the server array; freshness comes
+            # from the file's mtime
+            header = {'version': _CACHE_VERSION}
+            _atomic_write(constants.CACHE_FILE, _json_dumps(header, indent=False) + b'\n' + _json_dumps(servers))
             logger.debug(f"Cached {len(servers)} servers")
         except Exception as e:
             logger.error(f"Error saving servers cache: {str(e)}")
@@ -194,19 +271,28 @@ class StateManager:
     def load_servers_cache() -> Optional[List[Dict[str, Any]]]:
         """Load servers from cache file"""
         try:
-            if not os.path.exists(constants.CACHE_FILE):
-                return None
-
-            with open(constants.CACHE_FILE, 'r', encoding='utf-8') as f:
-                cache_data = json.load(f)
-
-            # Check cache age (24 hours)
-            cached_time = datetime.fromisoformat(cache_data['timestamp'])
-            if (datetime.now() - cached_time).total_seconds() > 86400:  # 24 hours
-                logger.debug("Server cache is stale, ignoring")
+            try:
+                f = open(constants.CACHE_FILE, 'rb')
+            except FileNotFoundError:
                 return None
 
-            servers = cache_data.get('servers', [])
+            with f:
+                # Check cache age (24 hours)
+                if time.time() - os.fstat(f.fileno()).st_mtime > 86400:
+                    logger.debug("Server cache is stale, ignoring")
+                    return None
+
+                try:
+                    header = _json_loads(f.readline())
+                except ValueError:
+                    # Version 1.0 caches are a single indented document
+                    f.seek(0)
+                    servers = _json_loads(f.read()).get('servers', [])
+                else:
+                    if not isinstance(header, dict) or header.get('version') != _CACHE_VERSION:
+                        logger.debug("Unknown server cache version, ignoring")
+                        return None
+                    servers = _json_loads(f.read())
             logger.info(f"Loaded {len(servers)} servers from cache")
             return servers
 
@@ -218,46 +304,68 @@ class StateManager:
     def save_state(state: ThreadSafeState, settings: AppSettings):
         """Save complete application state"""
         try:
-            proxy_instances = state.get_proxy_instances()
-            running_processes = state.get_running_processes()
-            private_key, public_key = state.get_keys()
-
-            state_dict = {
-                'client_keys': {
-                    'private_key': private_key,
-                    'public_key': public_key
-                },
-                'proxies': [],
-                'settings': {
-                    'last_port': 1080  # This would need to be passed in
-                }
+            payload, proxy_count = StateManager._build_state_payload(state)
+            StateManager._write_state_file(payload, proxy_count)
+        except Exception as e:
+            logger.error(f"Error saving state: {str(e)}")
+
+    @staticmethod
+    def save_state_async(state: ThreadSafeState, settings: AppSettings,
+                         executor: concurrent.futures.Executor) -> Optional[concurrent.futures.Future]:
+        """Snapshot state on the calling thread and write it to disk on the executor"""
+        try:
+            payload, proxy_count = StateManager._build_state_payload(state)
+            return executor.submit(StateManager._write_state_file, payload, proxy_count)
+        except Exception as e:
+            logger.error(f"Error saving state: {str(e)}")
+            return None
+
+    @staticmethod
+    def _running_flags(proxy_instances: List[ProxyInstance],
+                       running_processes: Mapping[int, ProcessInfo]) -> List[bool]:
+        """Flag each proxy that is marked running and whose process is still alive"""
+        count = len(proxy_instances)
+        flags = [False] * count
+        for index, process_info in running_processes.items():
+            if (0 <= index < count and
+                    proxy_instances[index].status is _RUNNING and
+                    process_info.process.poll() is None):
+                flags[index] = True
+        return flags
+
+    @staticmethod
+    def _build_state_payload(state: ThreadSafeState) -> Tuple[bytes, int]:
+        """Serialize the current state, returning the JSON bytes and the proxy count"""
+        proxy_instances, running_processes, private_key, public_key = state._snapshot_for_save()
+
+        state_dict = {
+            'client_keys': {
+                'private_key': private_key,
+                'public_key': public_key
+            },
+            'proxies': [],
+            'settings': {
+                'last_port': 1080  # This would need to be passed in
             }
+        }
 
-            # Save proxy instances with auto-restart info
-            for i, instance in enumerate(proxy_instances):
-                process_info = running_processes.get(i)
-                is_actually_running = (
-                        instance.status == ProxyStatus.RUNNING and
-                        process_info is not None and
-                        process_info.process.poll() is None
-                )
+        # Save proxy instances with auto-restart info
+        running_flags = StateManager._running_flags(proxy_instances, running_processes)
+        state_dict['proxies'] = [
+            instance.to_dict(running)
+            for instance, running in zip(proxy_instances, running_flags)
+        ]
 
-                proxy_data = {
-                    'country': instance.country,
-                    'location': instance.location,
-                    'port': instance.port,
-                    'status': instance.status.value,
-                    'server': instance.server,
-                    'connection_attempts': instance.connection_attempts,
-                    'created_at': instance.created_at.isoformat(),
-                    'auto_restart': is_actually_running
-                }
-                state_dict['proxies'].append(proxy_data)
+        return _json_dumps(state_dict), len(proxy_instances)
 
-            with open(constants.STATE_FILE, 'w', encoding='utf-8') as f:
-                json.dump(state_dict, f, indent=2, default=str)
+    @staticmethod
+    def _write_state_file(payload: bytes, proxy_count: int):
+        """Write serialized state to disk"""
+        try:
+            # Synced, since losing it would drop the proxy list and keys
+            _atomic_write(constants.STATE_FILE, payload, fsync=True)
 
-            logger.info(f"Saved complete state with {len(proxy_instances)} proxies")
+            logger.info(f"Saved complete state with {proxy_count} proxies")
 
         except Exception as e:
             logger.error(f"Error saving state: {str(e)}")
@@ -268,13 +376,13 @@ class StateManager:
         auto_restart_list = []
 
         try:
-            if not os.path.exists(constants.STATE_FILE):
+            try:
+                with open(constants.STATE_FILE, 'rb') as f:
+                    state_dict = _json_loads(f.read())
+            except FileNotFoundError:
                 logger.debug("No saved state file found")
                 return auto_restart_list
 
-            with open(constants.STATE_FILE, 'r', encoding='utf-8') as f:
-                state_dict = json.load(f)
-
             # Restore keys
             if 'client_keys' in state_dict:
                 private_key = state_dict['client_keys'].get('private_key', '')
@@ -283,7 +391,9 @@ class StateManager:
 
             # Restore proxies
             proxy_instances = []
+            now = datetime.now()
             for i, proxy_data in enumerate(state_dict.get('proxies', [])):
+                created_at = proxy_data.get('created_at')
                 instance = ProxyInstance(
                     id=i,
                     country=proxy_data['country'],
@@ -291,7 +401,7 @@ class StateManager:
                     port=proxy_data['port'],
                     server=proxy_data['server'],
                     status=ProxyStatus.STOPPED,  # Always start as stopped
-                    created_at=datetime.fromisoformat(proxy_data.get('created_at', datetime.now().isoformat())),
+                    created_at=datetime.fromisoformat(created_at) if created_at else now,
                     connection_attempts=proxy_data.get('connection_attempts', 0)
                 )
 
@@ -317,9 +427,10 @@ class StateManager:
         cleaned = 0
         for filepath in temp_files:
             try:
-                if os.path.exists(filepath):
-                    os.unlink(filepath)
-                    cleaned += 1
+                os.unlink(filepath)
+                cleaned += 1
+            except FileNotFoundError:
+                pass
             except OSError as e:
                 logger.warning(f"Failed to clean temp file {filepath}: {e}")
 